@@ -7,18 +7,23 @@ environment and compares their debug_traceTransaction (callTracer) outputs.
 """
 
 import argparse
+import gzip
+import hashlib
+import io
 import json
+import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-
-import requests
+from typing import Any, Optional
 
 from json_comparator import compare_call_traces, ComparisonResult
+from rpc_common import JSON_HEADERS, dumps as _dumps, loads as _loads, new_session
 
 
 # Configuration
@@ -45,8 +50,20 @@ DEFAULT_SCENARIOS = [
     "InsufficientBalance",
 ]
 
+DEFAULT_PARALLELISM = 4
 
-@dataclass
+_TX_HASH_RE = re.compile(r'0x[0-9a-fA-F]{64}')
+_TX_HASH_STRICT_RE = re.compile(r'^0x[0-9a-fA-F]{64}$')
+
+# Forge prints the broadcast result at the end of its output
+_TX_HASH_SCAN_LINES = 50
+DEFAULT_CACHE_DIR = Path("output/.rpc_cache")
+
+# Serializes console output from concurrently running scenarios
+_PRINT_LOCK = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Result of a single test scenario."""
     scenario: str
@@ -79,33 +96,33 @@ class TestSuite:
         return len(self.results)
     
     def summary(self) -> str:
-        lines = [
-            "=" * 60,
-            "TEST SUITE SUMMARY",
-            "=" * 60,
-            f"Total:  {self.total_count}",
-            f"Passed: {self.passed_count}",
-            f"Failed: {self.failed_count}",
-            "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 60 + "\n")
+        w("TEST SUITE SUMMARY\n")
+        w("=" * 60 + "\n")
+        w(f"Total:  {self.total_count}\n")
+        w(f"Passed: {self.passed_count}\n")
+        w(f"Failed: {self.failed_count}\n")
+        w("\n")
         
         if self.failed_count > 0:
-            lines.append("Failed scenarios:")
+            w("Failed scenarios:\n")
             for result in self.results:
                 if not result.passed:
-                    lines.append(f"  ✗ {result.scenario}")
+                    w(f"  ✗ {result.scenario}\n")
                     if result.error_message:
-                        lines.append(f"    Error: {result.error_message}")
+                        w(f"    Error: {result.error_message}\n")
                     elif result.comparison:
-                        lines.append(f"    Differences: {len(result.comparison.differences)}")
+                        w(f"    Differences: {len(result.comparison.differences)}\n")
         
-        lines.append("")
-        lines.append("Passed scenarios:")
+        w("\n")
+        w("Passed scenarios:")
         for result in self.results:
             if result.passed:
-                lines.append(f"  ✓ {result.scenario}")
+                w(f"\n  ✓ {result.scenario}")
         
-        return '\n'.join(lines)
+        return buf.getvalue()
 
 
 class KurtosisHelper:
@@ -113,9 +130,21 @@ class KurtosisHelper:
     
     def __init__(self, enclave: str = DEFAULT_ENCLAVE):
         self.enclave = enclave
+        self._rpc_ports: dict[str, int] = {}
     
     def get_service_rpc_port(self, service_name: str) -> int:
-        """Get the RPC port for a service from Kurtosis."""
+        """
+        Get the RPC port for a service from Kurtosis.
+        
+        Ports don't change for the lifetime of an enclave, so each service
+        is only inspected once per helper.
+        """
+        if service_name not in self._rpc_ports:
+            self._rpc_ports[service_name] = self._inspect_rpc_port(service_name)
+        return self._rpc_ports[service_name]
+    
+    def _inspect_rpc_port(self, service_name: str) -> int:
+        """Read a service's public RPC port via `kurtosis service inspect`."""
         try:
             result = subprocess.run(
                 ["kurtosis", "service", "inspect", "-o", "json", self.enclave, service_name],
@@ -142,19 +171,45 @@ class KurtosisHelper:
 
 
 class EthereumRPCClient:
-    """Client for making Ethereum JSON-RPC calls."""
+    """
+    Client for making Ethereum JSON-RPC calls.
     
-    def __init__(self, rpc_url: str, timeout: int = 30):
+    Calls share a pooled keep-alive session; use the client as a context
+    manager (or call ``close()``) to release its connections.
+    """
+    
+    def __init__(self, rpc_url: str, timeout: int = 30, cache_dir: Optional[Path] = None):
         self.rpc_url = rpc_url
         self.timeout = timeout
+        self.cache_dir = cache_dir
         self._request_id = 0
+        self._id_lock = threading.Lock()
+        
+        self._session = new_session(pool_connections=8, pool_maxsize=32, retries=3, backoff_factor=0.1)
+        self._session.headers.update(JSON_HEADERS)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+    
+    def __enter__(self) -> "EthereumRPCClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _next_id(self) -> int:
-        self._request_id += 1
-        return self._request_id
+        with self._id_lock:
+            self._request_id += 1
+            return self._request_id
     
-    def call(self, method: str, params: list) -> dict:
-        """Make a JSON-RPC call."""
+    def call_raw(self, method: str, params: list) -> tuple[dict, bytes]:
+        """
+        Make a JSON-RPC call and also return the undecoded response body.
+        
+        The body is parsed straight from bytes, never via ``response.text``,
+        so large traces are not held as bytes, str and dict at once.
+        """
         payload = {
             "jsonrpc": "2.0",
             "id": self._next_id(),
@@ -162,21 +217,63 @@ class EthereumRPCClient:
             "params": params
         }
         
-        response = requests.post(
+        response = self._session.post(
             self.rpc_url,
             json=payload,
-            headers={"Content-Type": "application/json"},
             timeout=self.timeout
         )
         response.raise_for_status()
         
-        result = response.json()
+        body = response.content
+        result = _loads(body)
         
         if "error" in result:
             raise RuntimeError(f"RPC error: {result['error']}")
         
+        return result, body
+    
+    def call(self, method: str, params: list) -> dict:
+        """Make a JSON-RPC call."""
+        result, _ = self.call_raw(method, params)
         return result
     
+    def batch_call(self, calls: list[tuple[str, list]]) -> list[dict]:
+        """
+        Make several JSON-RPC calls in a single HTTP request.
+        
+        Returns:
+            One response object per call, in the order of ``calls``.
+            Per-call errors are left in the individual responses.
+        """
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": self._next_id(),
+                "method": method,
+                "params": params
+            }
+            for method, params in calls
+        ]
+        
+        response = self._session.post(
+            self.rpc_url,
+            json=payload,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        
+        results = _loads(response.content)
+        
+        # A non-array reply means the whole batch was rejected
+        if not isinstance(results, list):
+            raise RuntimeError(f"RPC error: {results.get('error', results)}")
+        
+        by_id = {r.get("id"): r for r in results}
+        return [
+            by_id.get(p["id"], {"error": f"No response for {p['method']}"})
+            for p in payload
+        ]
+    
     def get_transaction_by_hash(self, tx_hash: str) -> Optional[dict]:
         """Get transaction details by hash."""
         try:
@@ -185,18 +282,72 @@ class EthereumRPCClient:
         except Exception:
             return None
     
+    def get_transaction_and_receipt(self, tx_hash: str) -> tuple[Optional[dict], Optional[dict]]:
+        """Get transaction details and receipt in one round trip."""
+        try:
+            tx, receipt = self.batch_call([
+                ("eth_getTransactionByHash", [tx_hash]),
+                ("eth_getTransactionReceipt", [tx_hash]),
+            ])
+            return tx.get("result"), receipt.get("result")
+        except Exception:
+            return None, None
+    
+    def _trace_cache_path(self, tx_hash: str, tracer: str) -> Optional[Path]:
+        """Location of the cached trace for this endpoint, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha1(f"{self.rpc_url}{tx_hash}{tracer}".encode()).hexdigest()
+        return self.cache_dir / key[:2] / key
+    
     def debug_trace_transaction(self, tx_hash: str, tracer: str = "callTracer") -> dict:
-        """Call debug_traceTransaction with the specified tracer."""
-        return self.call("debug_traceTransaction", [tx_hash, {"tracer": tracer}])
-    
-    def wait_for_transaction(self, tx_hash: str, max_attempts: int = 60, delay: float = 1.0) -> bool:
-        """Wait for a transaction to be indexed."""
-        for _ in range(max_attempts):
-            tx = self.get_transaction_by_hash(tx_hash)
-            if tx is not None:
+        """
+        Call debug_traceTransaction with the specified tracer.
+        
+        If the client has a ``cache_dir``, responses are cached on disk keyed
+        by endpoint, transaction hash and tracer. Traces of a mined
+        transaction never change, so entries do not expire.
+        """
+        cache_file = self._trace_cache_path(tx_hash, tracer)
+        if cache_file is not None and cache_file.exists():
+            return _loads(cache_file.read_bytes())
+        
+        response, body = self.call_raw("debug_traceTransaction", [tx_hash, {"tracer": tracer}])
+        
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry.
+            # The body is stored as received rather than re-serialized.
+            temp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+            temp_file.write_bytes(body)
+            os.replace(temp_file, cache_file)
+        
+        return response
+    
+    def wait_for_transaction(
+        self,
+        tx_hash: str,
+        total_timeout_seconds: float = 60.0,
+        delay: float = 0.05,
+        delay_cap: float = 2.0
+    ) -> bool:
+        """
+        Wait for a transaction to be indexed and mined.
+        
+        Polls with exponential backoff starting at ``delay`` and capped at
+        ``delay_cap``, so quickly mined transactions are seen almost
+        immediately while the overall wait is still bounded.
+        """
+        start = time.monotonic()
+        while True:
+            tx, receipt = self.get_transaction_and_receipt(tx_hash)
+            if tx is not None and receipt is not None:
                 return True
-            time.sleep(delay)
-        return False
+            remaining = total_timeout_seconds - (time.monotonic() - start)
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay_cap, delay * 1.5)
 
 
 class ForgeRunner:
@@ -205,11 +356,17 @@ class ForgeRunner:
     def __init__(self, contracts_dir: Path, private_key: str = DEFAULT_PRIVATE_KEY):
         self.contracts_dir = contracts_dir
         self.private_key = private_key
+        # All scripts broadcast from the same key, so concurrent runs would
+        # race on the account nonce
+        self._broadcast_lock = threading.Lock()
     
     def run_script(self, script_name: str, rpc_url: str) -> tuple[str, str]:
         """
         Run a Forge script and return the output.
         
+        Scripts are serialized across threads; only one broadcast is in
+        flight at a time.
+        
         Returns:
             Tuple of (stdout, stderr)
         """
@@ -224,13 +381,14 @@ class ForgeRunner:
             "--broadcast"
         ]
         
-        result = subprocess.run(
-            cmd,
-            cwd=self.contracts_dir,
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        with self._broadcast_lock:
+            result = subprocess.run(
+                cmd,
+                cwd=self.contracts_dir,
+                capture_output=True,
+                text=True,
+                timeout=120
+            )
         
         return result.stdout, result.stderr
     
@@ -263,7 +421,8 @@ def extract_tx_hash(output: str) -> str:
     # Try to parse as JSON first
     try:
         # Forge outputs multiple JSON objects, take the last valid one
-        for line in reversed(output.strip().split('\n')):
+        lines = output.strip().rsplit('\n', _TX_HASH_SCAN_LINES)[-_TX_HASH_SCAN_LINES:]
+        for line in reversed(lines):
             if line.strip().startswith('{'):
                 try:
                     data = json.loads(line)
@@ -271,7 +430,7 @@ def extract_tx_hash(output: str) -> str:
                     for key in ['tx_hash', 'txHash', 'hash']:
                         if key in data:
                             tx_hash = data[key]
-                            if re.match(r'^0x[0-9a-fA-F]{64}$', tx_hash):
+                            if _TX_HASH_STRICT_RE.match(tx_hash):
                                 return tx_hash
                 except json.JSONDecodeError:
                     continue
@@ -279,20 +438,45 @@ def extract_tx_hash(output: str) -> str:
         pass
     
     # Fallback: grep for tx hash pattern
-    matches = re.findall(r'0x[0-9a-fA-F]{64}', output)
+    matches = _TX_HASH_RE.findall(output)
     if matches:
         return matches[-1]  # Return the last match
     
     raise ValueError("Could not extract transaction hash from output")
 
 
+def _dump_json(obj: Any, path: Path, indent: bool = True, compress: bool = False) -> Path:
+    """
+    Write ``obj`` to ``path`` as JSON.
+    
+    With ``compress`` the data is gzipped and ``.gz`` is appended to the
+    file name. Returns the path actually written.
+    """
+    data = _dumps(obj, indent=indent)
+    if compress:
+        path = path.with_name(path.name + ".gz")
+        with gzip.open(path, "wb") as f:
+            f.write(data)
+    else:
+        path.write_bytes(data)
+    return path
+
+
+def _flush_output(out: io.StringIO) -> None:
+    """Write a scenario's buffered output to stdout as one block."""
+    with _PRINT_LOCK:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+
 def run_scenario(
     scenario: str,
     forge_runner: ForgeRunner,
     geth_client: EthereumRPCClient,
     besu_client: EthereumRPCClient,
     output_dir: Path,
-    verbose: bool = False
+    verbose: bool = False,
+    compress: bool = False
 ) -> TestResult:
     """
     Run a single test scenario.
@@ -301,54 +485,67 @@ def run_scenario(
     2. Wait for transaction on both clients
     3. Get callTracer results from both
     4. Compare outputs
+    
+    Output is buffered and written in one block when the scenario finishes,
+    so scenarios running on different threads don't interleave.
     """
     start_time = time.time()
+    out = io.StringIO()
     
-    print(f"\n{'='*60}")
-    print(f"Running Scenario: {scenario}")
-    print(f"{'='*60}")
+    def log(*args) -> None:
+        print(*args, file=out)
+    
+    log(f"\n{'='*60}")
+    log(f"Running Scenario: {scenario}")
+    log(f"{'='*60}")
     
     try:
         # Run Forge script against Besu
-        print(f"\nExecuting Forge script on Besu...")
+        log(f"\nExecuting Forge script on Besu...")
         stdout, stderr = forge_runner.run_script(scenario, besu_client.rpc_url)
         
         if verbose:
-            print("Forge output:")
-            print(stdout[:2000] if len(stdout) > 2000 else stdout)
+            log("Forge output:")
+            log(stdout[:2000] if len(stdout) > 2000 else stdout)
         
         # Extract transaction hash
         tx_hash = extract_tx_hash(stdout)
-        print(f"Transaction Hash: {tx_hash}")
-        
-        # Wait for transaction on both clients
-        print("Waiting for transaction to be indexed...")
-        
-        if not besu_client.wait_for_transaction(tx_hash, max_attempts=60):
-            raise RuntimeError("Transaction not indexed by Besu within timeout")
-        
-        if not geth_client.wait_for_transaction(tx_hash, max_attempts=60):
-            raise RuntimeError("Transaction not indexed by Geth within timeout")
-        
-        print("Transaction indexed on both clients")
-        
-        # Get callTracer results
-        print("Fetching callTracer results...")
-        
-        geth_response = geth_client.debug_trace_transaction(tx_hash)
-        besu_response = besu_client.debug_trace_transaction(tx_hash)
+        log(f"Transaction Hash: {tx_hash}")
+        
+        # The two clients are independent endpoints, so query them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Wait for transaction on both clients
+            log("Waiting for transaction to be indexed...")
+            
+            besu_indexed = executor.submit(besu_client.wait_for_transaction, tx_hash, total_timeout_seconds=60.0)
+            geth_indexed = executor.submit(geth_client.wait_for_transaction, tx_hash, total_timeout_seconds=60.0)
+            
+            if not besu_indexed.result():
+                raise RuntimeError("Transaction not indexed by Besu within timeout")
+            
+            if not geth_indexed.result():
+                raise RuntimeError("Transaction not indexed by Geth within timeout")
+            
+            log("Transaction indexed on both clients")
+            
+            # Get callTracer results
+            log("Fetching callTracer results...")
+            
+            geth_trace = executor.submit(geth_client.debug_trace_transaction, tx_hash)
+            besu_trace = executor.submit(besu_client.debug_trace_transaction, tx_hash)
+            geth_response = geth_trace.result()
+            besu_response = besu_trace.result()
         
         # Save raw responses
         geth_file = output_dir / f"{scenario}_geth.json"
         besu_file = output_dir / f"{scenario}_besu.json"
         
-        with open(geth_file, 'w') as f:
-            json.dump(geth_response, f, indent=2)
-        
-        with open(besu_file, 'w') as f:
-            json.dump(besu_response, f, indent=2)
+        # Pretty-printing roughly doubles the file size; only do it when
+        # the output is likely to be read by a person
+        _dump_json(geth_response, geth_file, indent=verbose, compress=compress)
+        _dump_json(besu_response, besu_file, indent=verbose, compress=compress)
         
-        print(f"Results saved to {output_dir}")
+        log(f"Results saved to {output_dir}")
         
         # Quick gas comparison
         geth_gas = geth_response.get('result', {}).get('gasUsed', 'N/A')
@@ -356,26 +553,28 @@ def run_scenario(
         geth_type = geth_response.get('result', {}).get('type', 'N/A')
         besu_type = besu_response.get('result', {}).get('type', 'N/A')
         
-        print(f"\nQuick Comparison:")
-        print(f"  Gas Used - Geth: {geth_gas}, Besu: {besu_gas}")
-        print(f"  Call Type - Geth: {geth_type}, Besu: {besu_type}")
+        log(f"\nQuick Comparison:")
+        log(f"  Gas Used - Geth: {geth_gas}, Besu: {besu_gas}")
+        log(f"  Call Type - Geth: {geth_type}, Besu: {besu_type}")
         
-        # Full comparison
+        # Full comparison. The traces are normalized into copies: the raw
+        # responses are kept on the TestResult.
         comparison = compare_call_traces(
             geth_response.get('result', {}),
             besu_response.get('result', {})
         )
         
-        print(f"\n{comparison.summary()}")
+        log(f"\n{comparison.summary()}")
         
         if not comparison.is_match and verbose:
             # Save detailed diff
             diff_file = output_dir / f"{scenario}_diff.txt"
             with open(diff_file, 'w') as f:
                 f.write(comparison.detailed_report())
-            print(f"Detailed diff saved to {diff_file}")
+            log(f"Detailed diff saved to {diff_file}")
         
         duration = time.time() - start_time
+        _flush_output(out)
         
         return TestResult(
             scenario=scenario,
@@ -389,7 +588,8 @@ def run_scenario(
         
     except Exception as e:
         duration = time.time() - start_time
-        print(f"\n✗ ERROR: {e}")
+        log(f"\n✗ ERROR: {e}")
+        _flush_output(out)
         return TestResult(
             scenario=scenario,
             passed=False,
@@ -437,11 +637,28 @@ def main():
         action="store_true",
         help="Skip contract deployment"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Cache debug_traceTransaction responses in {DEFAULT_CACHE_DIR} "
+             "(only safe while the same node build is under test)"
+    )
+    parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help=f"Number of scenarios to run concurrently (default: {DEFAULT_PARALLELISM})"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Verbose output"
     )
+    parser.add_argument(
+        "--compress-output",
+        action="store_true",
+        help="Gzip the per-scenario trace files ({scenario}_geth.json.gz, ...)"
+    )
     parser.add_argument(
         "--save-report",
         type=Path,
@@ -470,10 +687,6 @@ def main():
     print(f"Geth RPC: {geth_rpc_url}")
     print(f"Besu RPC: {besu_rpc_url}")
     
-    # Initialize clients
-    geth_client = EthereumRPCClient(geth_rpc_url)
-    besu_client = EthereumRPCClient(besu_rpc_url)
-    
     # Initialize Forge runner
     contracts_dir = Path(__file__).parent / "contracts"
     forge_runner = ForgeRunner(contracts_dir, args.private_key)
@@ -488,16 +701,30 @@ def main():
     # Run scenarios
     suite = TestSuite(geth_rpc_url=geth_rpc_url, besu_rpc_url=besu_rpc_url)
     
-    for scenario in args.scenarios:
-        result = run_scenario(
-            scenario,
-            forge_runner,
-            geth_client,
-            besu_client,
-            args.output_dir,
-            args.verbose
-        )
-        suite.results.append(result)
+    cache_dir = DEFAULT_CACHE_DIR if args.cache else None
+    
+    results: dict[str, TestResult] = {}
+    with EthereumRPCClient(geth_rpc_url, cache_dir=cache_dir) as geth_client, \
+            EthereumRPCClient(besu_rpc_url, cache_dir=cache_dir) as besu_client, \
+            ThreadPoolExecutor(max_workers=max(1, args.parallelism)) as executor:
+        futures = {
+            executor.submit(
+                run_scenario,
+                scenario,
+                forge_runner,
+                geth_client,
+                besu_client,
+                args.output_dir,
+                args.verbose,
+                args.compress_output
+            ): scenario
+            for scenario in args.scenarios
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    # Keep the report in the order the scenarios were requested
+    suite.results.extend(results[scenario] for scenario in args.scenarios)
     
     # Print summary
     print("\n" + suite.summary())
@@ -522,8 +749,7 @@ def main():
                 for r in suite.results
             ]
         }
-        with open(args.save_report, 'w') as f:
-            json.dump(report, f, indent=2)
+        _dump_json(report, args.save_report)
         print(f"\nReport saved to {args.save_report}")
     
     # Exit with appropriate code
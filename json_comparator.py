@@ -5,13 +5,37 @@ Provides deep JSON comparison with semantic understanding of Ethereum
 callTracer structures, including normalization and diff generation.
 """
 
+import difflib
+import io
 import json
+import textwrap
 from typing import Any, Optional
 from dataclasses import dataclass, field
+from collections import deque
 from collections.abc import Mapping, Sequence
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
 
-@dataclass
+
+# Fields to include in normalized output (in order)
+_FIELDS = ('from', 'to', 'type', 'input', 'output', 'error', 'revertReason',
+           'gas', 'gasUsed', 'value', 'calls')
+_FIELD_SET = frozenset(_FIELDS)
+
+# Numeric fields whose hex encoding may differ only in leading zeros
+_QUANTITY_FIELDS = ('gas', 'gasUsed', 'value')
+
+# Values whose compact JSON is at least this long are not pretty-printed
+_PRETTY_PRINT_LIMIT = 1024
+
+# Placeholder for a key that is present on only one side of a comparison
+_MISSING = object()
+
+
+@dataclass(slots=True, frozen=True)
 class DiffResult:
     """Represents a difference found between two JSON structures."""
     path: str
@@ -31,7 +55,7 @@ class DiffResult:
             return f"{self.path}: Geth={self.geth_value} vs Besu={self.besu_value}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparisonResult:
     """Complete comparison result between Geth and Besu callTracer outputs."""
     is_match: bool
@@ -65,25 +89,32 @@ class ComparisonResult:
         if self.is_match:
             return "Results match exactly - no differences found."
         
-        lines = [
-            "=" * 60,
-            "DETAILED COMPARISON REPORT",
-            "=" * 60,
-            f"Total differences: {len(self.differences)}",
-            ""
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w("=" * 60 + "\n")
+        w("DETAILED COMPARISON REPORT\n")
+        w("=" * 60 + "\n")
+        w(f"Total differences: {len(self.differences)}\n")
         
         for i, diff in enumerate(self.differences, 1):
-            lines.extend([
-                f"Difference #{i}:",
-                f"  Path: {diff.path}",
-                f"  Type: {diff.diff_type}",
-                f"  Geth: {json.dumps(diff.geth_value, indent=4) if isinstance(diff.geth_value, (dict, list)) else diff.geth_value}",
-                f"  Besu: {json.dumps(diff.besu_value, indent=4) if isinstance(diff.besu_value, (dict, list)) else diff.besu_value}",
-                ""
-            ])
+            w(f"\nDifference #{i}:\n")
+            w(f"  Path: {diff.path}\n")
+            w(f"  Type: {diff.diff_type}\n")
+            w(f"  Geth: {_format_value(diff.geth_value)}\n")
+            w(f"  Besu: {_format_value(diff.besu_value)}\n")
         
-        return '\n'.join(lines)
+        return buf.getvalue()
+
+
+def _format_value(value: Any) -> Any:
+    """Render a differing value for the detailed report."""
+    if not isinstance(value, (dict, list)):
+        return value
+    compact = _dumps(value)
+    # Large nested values are unreadable either way; skip pretty-printing them
+    if len(compact) >= _PRETTY_PRINT_LIMIT:
+        return compact
+    return _dumps(value, indent=True)
 
 
 def normalize_call_trace(trace: dict) -> dict:
@@ -91,42 +122,89 @@ def normalize_call_trace(trace: dict) -> dict:
     Normalize a callTracer result for comparison.
     
     This removes null/empty values and ensures consistent ordering,
-    matching the normalization behavior in the bash script.
+    matching the normalization behavior in the bash script. Hex
+    quantities (gas, gasUsed, value) lose their leading zeros, since
+    Geth and Besu disagree on forms like 0x0 vs 0x00.
     """
     if not isinstance(trace, dict):
         return trace
     
-    # Fields to include in normalized output (in order)
-    fields = ['from', 'to', 'type', 'input', 'output', 'error', 'revertReason', 
-              'gas', 'gasUsed', 'value', 'calls']
+    root = {}
+    # (source frame, normalized frame to fill in); nested calls are queued
+    # instead of recursed into
+    stack = [(trace, root)]
+    while stack:
+        frame, normalized = stack.pop()
+        get = frame.get
+        
+        for name in _FIELDS:
+            value = get(name)
+            if value is None:
+                continue
+            if name == 'calls':
+                if isinstance(value, list) and len(value) > 0:
+                    calls = []
+                    for call in value:
+                        if isinstance(call, dict):
+                            child = {}
+                            stack.append((call, child))
+                            calls.append(child)
+                        else:
+                            calls.append(call)
+                    normalized['calls'] = calls
+            elif name in _QUANTITY_FIELDS:
+                normalized[name] = normalize_hex_value(value)
+            else:
+                normalized[name] = value
     
-    normalized = {}
+    return root
+
+
+def normalize_call_trace_inplace(trace: dict) -> dict:
+    """
+    Normalize a callTracer result in place.
+    
+    Produces the same fields as normalize_call_trace, but deletes unwanted
+    keys from ``trace`` and its nested calls instead of copying into new
+    dicts. Only use this when the raw trace is not needed afterwards.
+    """
+    if not isinstance(trace, dict):
+        return trace
     
-    for field in fields:
-        if field in trace and trace[field] is not None:
-            if field == 'calls':
-                # Recursively normalize nested calls
-                calls = trace[field]
-                if isinstance(calls, list) and len(calls) > 0:
-                    normalized['calls'] = [normalize_call_trace(call) for call in calls]
+    stack = [trace]
+    while stack:
+        node = stack.pop()
+        for key in [k for k, v in node.items() if v is None or k not in _FIELD_SET]:
+            del node[key]
+        for key in _QUANTITY_FIELDS:
+            if key in node:
+                node[key] = normalize_hex_value(node[key])
+        calls = node.get('calls')
+        if calls is not None:
+            if isinstance(calls, list) and len(calls) > 0:
+                stack.extend(call for call in calls if isinstance(call, dict))
             else:
-                normalized[field] = trace[field]
+                del node['calls']
     
-    return normalized
+    return trace
 
 
 def normalize_hex_value(value: Any) -> Any:
     """Normalize hex values for comparison (handles 0x0 vs 0x00 differences)."""
-    if isinstance(value, str) and value.startswith('0x'):
-        # Remove leading zeros but keep at least one digit
-        if len(value) > 2:
-            stripped = value[2:].lstrip('0') or '0'
-            return '0x' + stripped
+    # Only strings with a leading zero digit need rewriting; everything
+    # else is returned without slicing
+    if isinstance(value, str) and value[:3] == '0x0' and len(value) > 3:
+        return '0x' + (value[2:].lstrip('0') or '0')
     return value
 
 
 def deep_normalize_hex(obj: Any) -> Any:
-    """Recursively normalize all hex values in a structure."""
+    """
+    Recursively normalize all hex values in a structure.
+    
+    Note this also strips leading zeros from byte strings such as input
+    and output data; normalize_call_trace only touches quantity fields.
+    """
     if isinstance(obj, dict):
         return {k: deep_normalize_hex(v) for k, v in obj.items()}
     elif isinstance(obj, list):
@@ -135,6 +213,19 @@ def deep_normalize_hex(obj: Any) -> Any:
         return normalize_hex_value(obj)
 
 
+def traces_equal(geth_obj: Any, besu_obj: Any) -> bool:
+    """
+    Check two whole traces for equality with a single C-level comparison.
+    
+    That comparison recurses in C, so traces nested too deeply for it are
+    reported as unequal and left to the stack-based comparisons.
+    """
+    try:
+        return geth_obj is besu_obj or geth_obj == besu_obj
+    except RecursionError:
+        return False
+
+
 def compare_json_recursive(
     geth_obj: Any,
     besu_obj: Any,
@@ -142,69 +233,168 @@ def compare_json_recursive(
     differences: Optional[list[DiffResult]] = None
 ) -> list[DiffResult]:
     """
-    Recursively compare two JSON objects and collect all differences.
+    Compare two JSON objects and collect all differences.
+    
+    Nested values are walked with an explicit stack instead of recursion, so
+    deeply nested call traces cannot hit the interpreter recursion limit.
+    Differences are reported in depth-first order.
     """
     if differences is None:
         differences = []
     
-    # Handle None/null cases
-    if geth_obj is None and besu_obj is None:
-        return differences
-    
-    if geth_obj is None:
-        differences.append(DiffResult(path, None, besu_obj, 'missing_in_geth'))
-        return differences
-    
-    if besu_obj is None:
-        differences.append(DiffResult(path, geth_obj, None, 'missing_in_besu'))
-        return differences
-    
-    # Type mismatch
-    if type(geth_obj) != type(besu_obj):
-        # Special case: int vs str for numeric comparisons
-        if isinstance(geth_obj, (int, str)) and isinstance(besu_obj, (int, str)):
-            geth_str = str(geth_obj)
-            besu_str = str(besu_obj)
-            if geth_str != besu_str:
-                differences.append(DiffResult(path, geth_obj, besu_obj, 'value_mismatch'))
-        else:
-            differences.append(DiffResult(path, geth_obj, besu_obj, 'type_mismatch'))
-        return differences
-    
-    # Compare dictionaries
-    if isinstance(geth_obj, Mapping):
-        all_keys = set(geth_obj.keys()) | set(besu_obj.keys())
-        for key in sorted(all_keys):
-            new_path = f"{path}.{key}"
-            if key not in geth_obj:
-                differences.append(DiffResult(new_path, None, besu_obj[key], 'missing_in_geth'))
-            elif key not in besu_obj:
-                differences.append(DiffResult(new_path, geth_obj[key], None, 'missing_in_besu'))
+    append = differences.append
+    stack = deque([(geth_obj, besu_obj, path)])
+    pop = stack.pop
+    
+    while stack:
+        geth_obj, besu_obj, path = pop()
+        
+        # Keys present on only one side
+        if geth_obj is _MISSING:
+            append(DiffResult(path, None, besu_obj, 'missing_in_geth'))
+            continue
+        
+        if besu_obj is _MISSING:
+            append(DiffResult(path, geth_obj, None, 'missing_in_besu'))
+            continue
+        
+        # Handle None/null cases
+        if geth_obj is None and besu_obj is None:
+            continue
+        
+        if geth_obj is None:
+            append(DiffResult(path, None, besu_obj, 'missing_in_geth'))
+            continue
+        
+        if besu_obj is None:
+            append(DiffResult(path, geth_obj, None, 'missing_in_besu'))
+            continue
+        
+        # Identical objects (interned strings, small ints, shared subtrees)
+        if geth_obj is besu_obj:
+            continue
+        
+        geth_type = type(geth_obj)
+        
+        # Equal scalars are the common case and need no further inspection.
+        # Dicts and lists are expanded below instead: == on them recurses in C
+        # over the whole subtree.
+        if (geth_type is not dict and geth_type is not list
+                and geth_obj == besu_obj and geth_type is type(besu_obj)):
+            continue
+        
+        # Type mismatch
+        if geth_type is not type(besu_obj):
+            # Special case: int vs str for numeric comparisons
+            if isinstance(geth_obj, (int, str)) and isinstance(besu_obj, (int, str)):
+                if str(geth_obj) != str(besu_obj):
+                    append(DiffResult(path, geth_obj, besu_obj, 'value_mismatch'))
             else:
-                compare_json_recursive(geth_obj[key], besu_obj[key], new_path, differences)
-    
-    # Compare lists/arrays
-    elif isinstance(geth_obj, Sequence) and not isinstance(geth_obj, str):
-        if len(geth_obj) != len(besu_obj):
-            differences.append(DiffResult(
-                f"{path}.length",
-                len(geth_obj),
-                len(besu_obj),
-                'value_mismatch'
-            ))
-        # Compare elements up to the shorter length
-        for i in range(min(len(geth_obj), len(besu_obj))):
-            compare_json_recursive(geth_obj[i], besu_obj[i], f"{path}[{i}]", differences)
-    
-    # Compare primitive values
-    else:
-        if geth_obj != besu_obj:
-            differences.append(DiffResult(path, geth_obj, besu_obj, 'value_mismatch'))
+                append(DiffResult(path, geth_obj, besu_obj, 'type_mismatch'))
+            continue
+        
+        # Compare dictionaries (callTracer output is always plain dicts/lists)
+        if geth_type is dict or isinstance(geth_obj, Mapping):
+            # Geth's key order first, then keys only Besu has; dicts keep
+            # insertion order so this is deterministic without sorting
+            children = [
+                (value, besu_obj[key] if key in besu_obj else _MISSING, f"{path}.{key}")
+                for key, value in geth_obj.items()
+            ]
+            children.extend(
+                (_MISSING, value, f"{path}.{key}")
+                for key, value in besu_obj.items()
+                if key not in geth_obj
+            )
+            stack.extend(reversed(children))
+        
+        # Compare lists/arrays
+        elif geth_type is list or (isinstance(geth_obj, Sequence) and not isinstance(geth_obj, str)):
+            if len(geth_obj) != len(besu_obj):
+                append(DiffResult(
+                    f"{path}.length",
+                    len(geth_obj),
+                    len(besu_obj),
+                    'value_mismatch'
+                ))
+            # Compare elements up to the shorter length
+            for i in reversed(range(min(len(geth_obj), len(besu_obj)))):
+                stack.append((geth_obj[i], besu_obj[i], f"{path}[{i}]"))
+        
+        # Primitive values that reach this point differ
+        else:
+            append(DiffResult(path, geth_obj, besu_obj, 'value_mismatch'))
     
     return differences
 
 
-def compare_call_traces(geth_result: dict, besu_result: dict, normalize: bool = True) -> ComparisonResult:
+def _build_callframe_comparator(fields: tuple[str, ...]):
+    """
+    Generate a comparator specialized for call frames with the given fields.
+    
+    The generated function compares each known field with an unrolled
+    lookup instead of generic per-key dispatch and walks nested ``calls``
+    with an explicit stack. Values that differ, and anything that isn't a
+    call frame, are handed to compare_json_recursive, so the differences
+    reported are the same as the generic walk's, in field order. Nested
+    calls are always expanded rather than compared with ``==``, which would
+    recurse in C over the whole subtree at every level.
+    """
+    body = []
+    for name in fields:
+        if name == 'calls':
+            continue
+        body.append(f"""
+        v1 = g_get({name!r}, _MISSING)
+        v2 = b_get({name!r}, _MISSING)
+        if v1 is not v2 and (v1 != v2 or type(v1) is not type(v2)):
+            _generic(v1, v2, path + {'.' + name!r}, diffs)""")
+    
+    calls_block = ""
+    if 'calls' in fields:
+        calls_block = """
+        c1 = g_get('calls', _MISSING)
+        c2 = b_get('calls', _MISSING)
+        if type(c1) is list and type(c2) is list:
+            if len(c1) != len(c2):
+                diffs.append(DiffResult(path + '.calls.length', len(c1), len(c2), 'value_mismatch'))
+            for i in reversed(range(min(len(c1), len(c2)))):
+                push((c1[i], c2[i], f"{path}.calls[{i}]"))
+        elif c1 is not c2:
+            _generic(c1, c2, path + '.calls', diffs)"""
+    
+    source = textwrap.dedent("""
+    def compare_callframe(g, b, path, diffs):
+        stack = [(g, b, path)]
+        push = stack.append
+        while stack:
+            g, b, path = stack.pop()
+            if type(g) is not dict or type(b) is not dict:
+                _generic(g, b, path, diffs)
+                continue
+            g_get = g.get
+            b_get = b.get
+    """) + textwrap.indent(textwrap.dedent("".join(body) + calls_block), " " * 8)
+    
+    namespace = {
+        '_MISSING': _MISSING,
+        '_generic': compare_json_recursive,
+        'DiffResult': DiffResult,
+    }
+    exec(compile(source, f"<callframe comparator {fields}>", "exec"), namespace)
+    return namespace['compare_callframe']
+
+
+# Comparator for normalized traces, which only ever contain _FIELDS
+_compare_callframe = _build_callframe_comparator(_FIELDS)
+
+
+def compare_call_traces(
+    geth_result: dict,
+    besu_result: dict,
+    normalize: bool = True,
+    inplace: bool = False
+) -> ComparisonResult:
     """
     Compare Geth and Besu callTracer results.
     
@@ -212,22 +402,36 @@ def compare_call_traces(geth_result: dict, besu_result: dict, normalize: bool =
         geth_result: The 'result' field from Geth's debug_traceTransaction response
         besu_result: The 'result' field from Besu's debug_traceTransaction response
         normalize: Whether to normalize the traces before comparison
+        inplace: Normalize the given traces in place instead of copying them.
+            Saves an allocation per call frame, but modifies the caller's data.
     
     Returns:
         ComparisonResult with detailed difference information
     """
-    if normalize:
+    if normalize and inplace:
+        geth_normalized = normalize_call_trace_inplace(geth_result)
+        besu_normalized = normalize_call_trace_inplace(besu_result)
+    elif normalize:
         geth_normalized = normalize_call_trace(geth_result)
         besu_normalized = normalize_call_trace(besu_result)
     else:
         geth_normalized = geth_result
         besu_normalized = besu_result
     
-    # Optionally normalize hex values
-    # geth_normalized = deep_normalize_hex(geth_normalized)
-    # besu_normalized = deep_normalize_hex(besu_normalized)
+    # Matching traces are the common case; skip the structural walk for them
+    if traces_equal(geth_normalized, besu_normalized):
+        return ComparisonResult(
+            is_match=True,
+            differences=[],
+            geth_normalized=geth_normalized,
+            besu_normalized=besu_normalized
+        )
     
-    differences = compare_json_recursive(geth_normalized, besu_normalized)
+    if normalize and isinstance(geth_normalized, dict) and isinstance(besu_normalized, dict):
+        differences = []
+        _compare_callframe(geth_normalized, besu_normalized, "root", differences)
+    else:
+        differences = compare_json_recursive(geth_normalized, besu_normalized)
     
     return ComparisonResult(
         is_match=len(differences) == 0,
@@ -237,23 +441,66 @@ def compare_call_traces(geth_result: dict, besu_result: dict, normalize: bool =
     )
 
 
-def format_json_diff(geth_json: dict, besu_json: dict) -> str:
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _dumps_sorted(obj: Any) -> str:
+    """Pretty-print ``obj`` as JSON with sorted keys."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(obj, indent=2, sort_keys=True)
+
+
+def _format_range(start: int, stop: int) -> str:
     """
-    Generate a side-by-side or unified diff view of two JSON objects.
+    Format a line range for a unified diff hunk header.
+    
+    Same format as difflib.unified_diff, which can't be used directly here
+    because it always matches lines with autojunk enabled.
     """
-    geth_lines = json.dumps(geth_json, indent=2, sort_keys=True).splitlines()
-    besu_lines = json.dumps(besu_json, indent=2, sort_keys=True).splitlines()
-    
-    import difflib
-    diff = difflib.unified_diff(
-        geth_lines,
-        besu_lines,
-        fromfile='Geth',
-        tofile='Besu',
-        lineterm=''
-    )
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def format_json_diff(geth_json: dict, besu_json: dict, context: int = 3) -> str:
+    """
+    Generate a unified diff view of two JSON objects.
+    
+    Only changed hunks and ``context`` surrounding lines are emitted. Junk
+    heuristics are disabled since structural lines such as "}," are common
+    in pretty-printed JSON and would otherwise be skipped when matching.
+    """
+    if geth_json == besu_json:
+        return ""
+    
+    geth_lines = _dumps_sorted(geth_json).splitlines()
+    besu_lines = _dumps_sorted(besu_json).splitlines()
+    
+    matcher = difflib.SequenceMatcher(a=geth_lines, b=besu_lines, autojunk=False)
+    
+    lines = ["--- Geth", "+++ Besu"]
+    for group in matcher.get_grouped_opcodes(context):
+        first, last = group[0], group[-1]
+        lines.append(f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@")
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                lines.extend(' ' + line for line in geth_lines[i1:i2])
+                continue
+            if tag in ('replace', 'delete'):
+                lines.extend('-' + line for line in geth_lines[i1:i2])
+            if tag in ('replace', 'insert'):
+                lines.extend('+' + line for line in besu_lines[j1:j2])
     
-    return '\n'.join(diff)
+    return '\n'.join(lines)
 
 
 def extract_gas_summary(trace: dict) -> dict:
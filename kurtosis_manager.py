@@ -7,24 +7,82 @@ replacing the bash-based setup scripts with more maintainable Python.
 """
 
 import argparse
+import asyncio
 import json
+import random
 import re
+import socket
 import subprocess
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from rpc_common import JSON_HEADERS, loads as _loads, session as _session
+
+try:
+    from kurtosis_sdk import KurtosisContext
+except ImportError:  # Read paths go through the kurtosis CLI instead
+    KurtosisContext = None
+
+try:
+    import yaml
+except ImportError:  # Fall back to a regex scan of the args file
+    yaml = None
 
 
 DEFAULT_ENCLAVE = "my-testnet"
 DEFAULT_PACKAGE = "github.com/ethpandaops/ethereum-package"
 DEFAULT_ARGS_FILE = "minimal-pectra.yaml"
 
+# Well-known EL service names, in probe order, and the pattern used to pick
+# one out of `kurtosis service list` when none of them exists
+_EL_GETH_RE = re.compile(r"^el-.*geth")
+_EL_BESU_RE = re.compile(r"^el-.*besu")
+_EL_SERVICES = {
+    "geth": (["el-1-geth-teku", "el-1-geth"], _EL_GETH_RE),
+    "besu": (["el-2-besu-teku", "el-2-besu"], _EL_BESU_RE),
+}
+
+# Errors from kurtosis_sdk calls that indicate a bug in how the API is called
+# (a wrong method name or signature) rather than an engine failure; these are
+# raised instead of falling back to the CLI
+_SDK_MISUSE_ERRORS = (AttributeError, TypeError)
+
+# eth_blockNumber request used for readiness polling, encoded once
+_BLOCK_NUMBER_REQUEST = b'{"jsonrpc":"2.0","id":1,"method":"eth_blockNumber","params":[]}'
+
+
+def _tcp_wait(host: str, port: int, timeout: float) -> bool:
+    """
+    Wait until host:port accepts TCP connections.
+
+    Retries with exponential backoff (50ms doubling up to 1s) and returns
+    False if the port is still closed after ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.5).close()
+            return True
+        except OSError:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(remaining, delay))
+        delay = min(1.0, delay * 2)
+
 
 class KurtosisManager:
     """Manager for Kurtosis enclaves running Ethereum clients."""
     
+    _GENESIS_RE = re.compile(r'^\s*genesis_delay\s*:\s*(\d+)', re.MULTILINE)
+    
     def __init__(
         self,
         enclave: str = DEFAULT_ENCLAVE,
@@ -34,6 +92,86 @@ class KurtosisManager:
         self.enclave = enclave
         self.package = package
         self.args_file = Path(args_file)
+        self._args_content: Optional[str] = None
+        self._args_mtime: Optional[int] = None
+        self._kurtosis_context = None
+        self._enclave_context = None
+        self._sdk_warned: set[str] = set()
+        self._url_cache: dict[tuple[str, str], str] = {}
+    
+    @property
+    def _content(self) -> str:
+        """Contents of the args file, re-read only when its mtime changes."""
+        mtime = self.args_file.stat().st_mtime_ns
+        if self._args_content is None or mtime != self._args_mtime:
+            self._args_content = self.args_file.read_text()
+            self._args_mtime = mtime
+        return self._args_content
+    
+    def _sdk_fallback(self, action: str, error: Exception) -> None:
+        """Report, once per action, that an engine API call fell back to the CLI."""
+        if action not in self._sdk_warned:
+            self._sdk_warned.add(action)
+            print(
+                f"Warning: Kurtosis engine API {action} failed "
+                f"({type(error).__name__}: {error}); using the kurtosis CLI",
+                file=sys.stderr
+            )
+    
+    def _sdk_enclave(self):
+        """
+        Enclave context from the Kurtosis engine API, or None.
+
+        Only available when kurtosis_sdk is installed and the local engine
+        is reachable. Callers fall back to the CLI on None, so lookups that
+        fail (e.g. the enclave doesn't exist yet) are retried next time.
+        AttributeError and TypeError are not caught: they mean the API is
+        being misused, which falling back would hide.
+        """
+        if KurtosisContext is None:
+            return None
+        if self._enclave_context is None:
+            try:
+                if self._kurtosis_context is None:
+                    self._kurtosis_context = KurtosisContext.create_from_local_engine()
+                self._enclave_context = self._kurtosis_context.get_enclave_context(self.enclave)
+            except _SDK_MISUSE_ERRORS:
+                raise
+            except Exception as e:
+                self._sdk_fallback("enclave lookup", e)
+                return None
+        return self._enclave_context
+    
+    def _sdk_services(self) -> Optional[list[str]]:
+        """Service names from the engine API, or None to use the CLI."""
+        enclave_ctx = self._sdk_enclave()
+        if enclave_ctx is None:
+            return None
+        try:
+            return list(enclave_ctx.get_services())
+        except _SDK_MISUSE_ERRORS:
+            raise
+        except Exception as e:
+            self._sdk_fallback("service list", e)
+            return None
+    
+    def _sdk_port_url(self, service: str, port_name: str) -> Optional[str]:
+        """Public URL of a service port from the engine API, or None."""
+        enclave_ctx = self._sdk_enclave()
+        if enclave_ctx is None:
+            return None
+        try:
+            service_ctx = enclave_ctx.get_service_context(service)
+            port = service_ctx.get_public_ports().get(port_name)
+            if port is None:
+                return None
+            host = service_ctx.get_maybe_public_ip_address() or "127.0.0.1"
+            return f"http://{host}:{port.number}"
+        except _SDK_MISUSE_ERRORS:
+            raise
+        except Exception as e:
+            self._sdk_fallback("port lookup", e)
+            return None
     
     def _run_cmd(self, cmd: list[str], check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
         """Run a shell command."""
@@ -42,8 +180,40 @@ class KurtosisManager:
         else:
             return subprocess.run(cmd, check=check)
     
+    async def _run_cmd_async(
+        self,
+        cmd: list[str],
+        check: bool = True,
+        capture: bool = False,
+        text: bool = True
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a command without blocking the event loop.
+
+        Mirrors _run_cmd: captured output is decoded to text unless ``text``
+        is false, and a non-zero exit raises CalledProcessError when
+        ``check`` is set. The child is terminated if the awaiting task is
+        cancelled.
+        """
+        pipe = asyncio.subprocess.PIPE if capture else None
+        proc = await asyncio.create_subprocess_exec(*cmd, stdout=pipe, stderr=pipe)
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.terminate()
+                await proc.wait()
+            raise
+        if capture and text:
+            stdout, stderr = stdout.decode(), stderr.decode()
+        if check and proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+    
     def enclave_exists(self) -> bool:
         """Check if the enclave already exists."""
+        if self._sdk_enclave() is not None:
+            return True
         try:
             self._run_cmd(
                 ["kurtosis", "enclave", "inspect", self.enclave],
@@ -75,8 +245,11 @@ class KurtosisManager:
         if besu_tag is None or besu_tag == "latest":
             return self.args_file
         
-        # Read and replace Besu tag
-        content = self.args_file.read_text()
+        # Read and replace Besu tag; nothing to write if the file doesn't
+        # use the latest image (e.g. it is already pinned)
+        content = self._content
+        if "hyperledger/besu:latest" not in content:
+            return self.args_file
         modified = content.replace(
             "hyperledger/besu:latest",
             f"hyperledger/besu:{besu_tag}"
@@ -94,11 +267,15 @@ class KurtosisManager:
         if not self.args_file.exists():
             return 120  # Default
         
-        content = self.args_file.read_text()
-        match = re.search(r'^\s*genesis_delay\s*:\s*(\d+)', content, re.MULTILINE)
-        if match:
-            return int(match.group(1))
-        return 120
+        if yaml is None:
+            match = self._GENESIS_RE.search(self._content)
+            return int(match.group(1)) if match else 120
+        
+        try:
+            data = yaml.safe_load(self._content) or {}
+            return int(data.get("network_params", {}).get("genesis_delay", 120))
+        except (yaml.YAMLError, AttributeError, TypeError, ValueError):
+            return 120
     
     def run_package(self, args_file: Path) -> None:
         """Run the Kurtosis package to start the testnet."""
@@ -112,80 +289,155 @@ class KurtosisManager:
             "--args-file", str(args_file)
         ])
     
-    def discover_cl_service(self) -> Optional[str]:
-        """Discover a Consensus Layer (Teku) service."""
-        candidates = ["cl-1-teku-geth", "cl-2-teku-besu", "cl-1-teku", "cl-2-teku"]
-        
-        for service in candidates:
-            try:
-                self._run_cmd(
-                    ["kurtosis", "port", "print", self.enclave, service, "http"],
-                    check=True,
-                    capture=True
-                )
-                return service
-            except subprocess.CalledProcessError:
-                continue
-        
-        # Fallback: list services and find one with teku
+    async def _list_services(self) -> list[str]:
+        """List service names in the enclave via `kurtosis service list`."""
+        services = self._sdk_services()
+        if services is not None:
+            return services
         try:
-            result = self._run_cmd(
+            result = await self._run_cmd_async(
                 ["kurtosis", "service", "list", self.enclave],
                 capture=True
             )
-            for line in result.stdout.splitlines()[1:]:  # Skip header
-                parts = line.split()
-                if parts and "teku" in parts[0]:
-                    return parts[0]
         except Exception:
-            pass
-        
-        return None
-    
-    def discover_el_service(self, client_type: str) -> Optional[str]:
-        """Discover an Execution Layer service (geth or besu)."""
-        if client_type == "geth":
-            candidates = ["el-1-geth-teku", "el-1-geth"]
-            pattern = r"^el-.*geth"
-        elif client_type == "besu":
-            candidates = ["el-2-besu-teku", "el-2-besu"]
-            pattern = r"^el-.*besu"
-        else:
-            raise ValueError(f"Unknown client type: {client_type}")
-        
-        for service in candidates:
+            return []
+        services = []
+        for line in result.stdout.splitlines()[1:]:  # Skip header
+            parts = line.split()
+            if parts:
+                services.append(parts[0])
+        return services
+
+    async def _first_available(
+        self,
+        candidates: list[str],
+        probe_cmd: Callable[[str], list[str]],
+        fallback: Callable[[list[str]], Optional[str]]
+    ) -> Optional[str]:
+        """
+        Probe candidate services concurrently.
+
+        Returns the first candidate, in priority order, whose probe command
+        succeeds. If none does, ``fallback`` is applied to the service list,
+        which is fetched concurrently with the probes. Probes still running
+        once the answer is known are cancelled.
+        """
+        # With the engine API a single service listing answers every probe
+        services = self._sdk_services()
+        if services is not None:
+            return next((s for s in candidates if s in services), None) or fallback(services)
+
+        async def probe(service: str) -> bool:
             try:
-                self._run_cmd(
-                    ["kurtosis", "service", "inspect", self.enclave, service],
-                    check=True,
-                    capture=True
-                )
-                return service
+                await self._run_cmd_async(probe_cmd(service), capture=True)
             except subprocess.CalledProcessError:
-                continue
-        
-        # Fallback: search service list
+                return False
+            return True
+
+        probes = [asyncio.create_task(probe(service)) for service in candidates]
+        listing = asyncio.create_task(self._list_services())
         try:
-            result = self._run_cmd(
-                ["kurtosis", "service", "list", self.enclave],
-                capture=True
+            for service, task in zip(candidates, probes):
+                if await task:
+                    return service
+            return fallback(await listing)
+        finally:
+            for task in (*probes, listing):
+                task.cancel()
+            await asyncio.gather(*probes, listing, return_exceptions=True)
+
+    async def discover_cl_service_async(self) -> Optional[str]:
+        """Discover a Consensus Layer (Teku) service."""
+        candidates = ["cl-1-teku-geth", "cl-2-teku-besu", "cl-1-teku", "cl-2-teku"]
+
+        # Fallback: list services and find one with teku
+        def find_teku(services: list[str]) -> Optional[str]:
+            return next((s for s in services if "teku" in s), None)
+
+        return await self._first_available(
+            candidates,
+            lambda service: ["kurtosis", "port", "print", self.enclave, service, "http"],
+            find_teku
+        )
+
+    def discover_cl_service(self) -> Optional[str]:
+        """Discover a Consensus Layer (Teku) service."""
+        return asyncio.run(self.discover_cl_service_async())
+
+    async def discover_el_service_async(self, client_type: str) -> Optional[str]:
+        """Discover an Execution Layer service (geth or besu)."""
+        try:
+            candidates, pattern = _EL_SERVICES[client_type]
+        except KeyError:
+            raise ValueError(f"Unknown client type: {client_type}") from None
+
+        # Fallback: search service list
+        def find_matching(services: list[str]) -> Optional[str]:
+            return next((s for s in services if pattern.match(s)), None)
+
+        return await self._first_available(
+            candidates,
+            lambda service: ["kurtosis", "service", "inspect", self.enclave, service],
+            find_matching
+        )
+
+    def discover_el_service(self, client_type: str) -> Optional[str]:
+        """Discover an Execution Layer service (geth or besu)."""
+        return asyncio.run(self.discover_el_service_async(client_type))
+
+    async def discover_el_services_async(self) -> dict[str, Optional[str]]:
+        """
+        Discover every known Execution Layer service from one service listing.
+
+        Known names are preferred, in priority order, over pattern matches.
+        Falls back to probing each client separately if the listing is
+        unavailable.
+        """
+        services = await self._list_services()
+        if not services:
+            found = await asyncio.gather(
+                *(self.discover_el_service_async(client) for client in _EL_SERVICES)
             )
-            for line in result.stdout.splitlines()[1:]:
-                parts = line.split()
-                if parts and re.match(pattern, parts[0]):
-                    return parts[0]
-        except Exception:
-            pass
-        
-        return None
-    
-    def get_port_url(self, service: str, port_name: str = "http") -> str:
-        """Get the full URL for a service port."""
-        url = None
+            return dict(zip(_EL_SERVICES, found))
+
+        names = set(services)
+        discovered = {}
+        for client, (candidates, pattern) in _EL_SERVICES.items():
+            discovered[client] = (
+                next((s for s in candidates if s in names), None)
+                or next((s for s in services if pattern.match(s)), None)
+            )
+        return discovered
+
+    def discover_el_services(self) -> dict[str, Optional[str]]:
+        """Discover every known Execution Layer service (geth and besu)."""
+        return asyncio.run(self.discover_el_services_async())
+
+    def invalidate_url_cache(self) -> None:
+        """Forget resolved port URLs, e.g. after the enclave is recreated."""
+        self._url_cache.clear()
+
+    async def get_port_url_async(self, service: str, port_name: str = "http") -> str:
+        """
+        Get the full URL for a service port.
+
+        Published ports don't change for the lifetime of an enclave, so
+        each (service, port_name) is only resolved once per manager.
+        """
+        key = (service, port_name)
+        if key not in self._url_cache:
+            self._url_cache[key] = await self._resolve_port_url(service, port_name)
+        return self._url_cache[key]
+
+    async def _resolve_port_url(self, service: str, port_name: str) -> str:
+        """Look up the URL for a service port via the engine API or CLI."""
+        url = self._sdk_port_url(service, port_name)
+        if url:
+            return url
 
         # Try kurtosis port print first
         try:
-            result = self._run_cmd(
+            result = await self._run_cmd_async(
                 ["kurtosis", "port", "print", self.enclave, service, port_name],
                 capture=True
             )
@@ -196,11 +448,12 @@ class KurtosisManager:
         # Fallback: construct from service inspect
         if not url:
             try:
-                result = self._run_cmd(
+                result = await self._run_cmd_async(
                     ["kurtosis", "service", "inspect", "-o", "json", self.enclave, service],
-                    capture=True
+                    capture=True,
+                    text=False
                 )
-                data = json.loads(result.stdout)
+                data = _loads(result.stdout)
                 port = data.get('public_ports', {}).get('rpc', {}).get('number')
                 if not port:
                     port = data.get('public_ports', {}).get('http', {}).get('number')
@@ -218,6 +471,10 @@ class KurtosisManager:
 
         return url
 
+    def get_port_url(self, service: str, port_name: str = "http") -> str:
+        """Get the full URL for a service port."""
+        return asyncio.run(self.get_port_url_async(service, port_name))
+
     def wait_for_beacon_genesis(self, cl_service: str) -> bool:
         """Wait for the Consensus Layer beacon genesis."""
         try:
@@ -227,9 +484,8 @@ class KurtosisManager:
             return False
 
         try:
-            import requests
-            response = requests.get(f"{cl_url}/eth/v1/beacon/genesis", timeout=10)
-            data = response.json()
+            response = _session().get(f"{cl_url}/eth/v1/beacon/genesis", timeout=10)
+            data = _loads(response.content)
             genesis_time = int(data['data']['genesis_time'])
         except Exception as e:
             print(f"WARN: CL genesis endpoint unavailable: {e}")
@@ -252,26 +508,38 @@ class KurtosisManager:
 
         import requests
 
-        attempts = timeout // 2
-        for attempt in range(1, attempts + 1):
+        session = _session()
+        deadline = time.monotonic() + timeout
+
+        # Wait for the port to open before starting the HTTP polling, so the
+        # first request goes out as soon as the node is listening
+        parts = urlsplit(rpc_url)
+        if parts.hostname:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            if verbose:
+                print(f"  Waiting for TCP port {parts.hostname}:{port}...")
+            _tcp_wait(parts.hostname, port, timeout)
+
+        delay = 0.1
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                response = requests.post(
+                response = session.post(
                     rpc_url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "eth_blockNumber",
-                        "params": []
-                    },
-                    headers={"Content-Type": "application/json"},
+                    data=_BLOCK_NUMBER_REQUEST,
+                    headers=JSON_HEADERS,
                     timeout=5
                 )
+                # The port is open, so probe again quickly while the node
+                # finishes starting
+                delay = 0.1
 
                 if verbose:
-                    print(f"  Attempt {attempt}/{attempts}: HTTP {response.status_code}")
+                    print(f"  Attempt {attempt}: HTTP {response.status_code}")
 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = _loads(response.content)
                     if verbose:
                         print(f"  Response: {result}")
 
@@ -282,22 +550,26 @@ class KurtosisManager:
                     elif "error" in result:
                         if verbose:
                             print(f"  RPC error: {result['error']}")
-                else:
-                    if verbose:
-                        print(f"  HTTP error: {response.status_code} - {response.text[:200]}")
+                elif verbose:
+                    # Only decode the body for this verbose error message
+                    body = response.content[:200].decode("utf-8", errors="replace")
+                    print(f"  HTTP error: {response.status_code} - {body}")
 
             except requests.exceptions.Timeout:
                 if verbose:
-                    print(f"  Attempt {attempt}/{attempts}: Timeout after 5s")
+                    print(f"  Attempt {attempt}: Timeout after 5s")
             except requests.exceptions.ConnectionError as e:
                 if verbose:
-                    print(f"  Attempt {attempt}/{attempts}: Connection error - {str(e)[:100]}")
+                    print(f"  Attempt {attempt}: Connection error - {str(e)[:100]}")
             except Exception as e:
                 if verbose:
-                    print(f"  Attempt {attempt}/{attempts}: Error - {type(e).__name__}: {str(e)[:100]}")
+                    print(f"  Attempt {attempt}: Error - {type(e).__name__}: {str(e)[:100]}")
 
-            if attempt < attempts:
-                time.sleep(2)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, random.uniform(delay * 0.5, delay)))
+            delay = min(2.0, delay * 1.5)
 
         print(f"WARN: {label} did not respond within {timeout}s timeout")
         print(f"  URL: {rpc_url}")
@@ -314,15 +586,39 @@ class KurtosisManager:
             ["kurtosis", "enclave", "rm", "-f", self.enclave],
             check=False
         )
+        self._enclave_context = None
+        self.invalidate_url_cache()
         print("Enclave stopped")
 
     def clean_all(self) -> None:
         """Complete cleanup of all Kurtosis resources."""
         print("Cleaning up all Kurtosis resources...")
         self._run_cmd(["kurtosis", "clean", "-a"], check=False)
+        self._enclave_context = None
+        self.invalidate_url_cache()
         print("Cleanup complete")
 
 
+async def _resolve_els(manager: KurtosisManager) -> list:
+    """
+    Discover the Geth and Besu services and their RPC URLs.
+
+    Returns a (service, url, error) tuple per client. Port lookups for both
+    clients run concurrently.
+    """
+    services = await manager.discover_el_services_async()
+
+    async def resolve(service: Optional[str]) -> tuple:
+        if not service:
+            return None, None, None
+        try:
+            return service, await manager.get_port_url_async(service, "rpc"), None
+        except Exception as e:
+            return service, None, e
+
+    return await asyncio.gather(resolve(services["geth"]), resolve(services["besu"]))
+
+
 def start_testnet(
     besu_tag: Optional[str] = None,
     enclave: str = DEFAULT_ENCLAVE,
@@ -370,47 +666,49 @@ def start_testnet(
 
         print("\nGenesis reached. Discovering EL services...")
 
-        # Discover EL services
-        geth_service = manager.discover_el_service("geth")
-        besu_service = manager.discover_el_service("besu")
+        # Discover EL services and resolve both URLs up front so the
+        # readiness waits can overlap
+        (geth_service, geth_url, geth_error), (besu_service, besu_url, besu_error) = \
+            asyncio.run(_resolve_els(manager))
 
         result = {
             "enclave": enclave,
             "geth_service": geth_service,
             "besu_service": besu_service,
-            "geth_rpc_url": None,
-            "besu_rpc_url": None
+            "geth_rpc_url": geth_url,
+            "besu_rpc_url": besu_url
         }
 
-        if geth_service:
-            try:
-                geth_url = manager.get_port_url(geth_service, "rpc")
-                result["geth_rpc_url"] = geth_url
-                if verbose:
-                    print(f"Discovered Geth service: {geth_service}")
-                    print(f"  Raw port lookup returned URL: {geth_url}")
-                print(f"Geth RPC: {geth_url} (service {geth_service})")
-                if not skip_wait:
-                    manager.wait_for_el_ready(geth_url, "Geth", verbose=verbose)
-                else:
-                    print("Skipping Geth readiness wait (--skip-wait enabled)")
-            except Exception as e:
-                print(f"WARN: Could not setup Geth: {e}")
-
-        if besu_service:
-            try:
-                besu_url = manager.get_port_url(besu_service, "rpc")
-                result["besu_rpc_url"] = besu_url
-                if verbose:
-                    print(f"Discovered Besu service: {besu_service}")
-                    print(f"  Raw port lookup returned URL: {besu_url}")
-                print(f"Besu RPC: {besu_url} (service {besu_service})")
-                if not skip_wait:
-                    manager.wait_for_el_ready(besu_url, "Besu", verbose=verbose)
-                else:
-                    print("Skipping Besu readiness wait (--skip-wait enabled)")
-            except Exception as e:
-                print(f"WARN: Could not setup Besu: {e}")
+        pending = []
+        for label, service, url, error in (
+            ("Geth", geth_service, geth_url, geth_error),
+            ("Besu", besu_service, besu_url, besu_error),
+        ):
+            if not service:
+                continue
+            if error is not None:
+                print(f"WARN: Could not setup {label}: {error}")
+                continue
+            if verbose:
+                print(f"Discovered {label} service: {service}")
+                print(f"  Raw port lookup returned URL: {url}")
+            print(f"{label} RPC: {url} (service {service})")
+            if skip_wait:
+                print(f"Skipping {label} readiness wait (--skip-wait enabled)")
+            else:
+                pending.append((label, url))
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    executor.submit(manager.wait_for_el_ready, url, label, verbose=verbose): label
+                    for label, url in pending
+                }
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        print(f"WARN: Could not setup {futures[future]}: {e}")
 
         print("\nServices should now be ready!")
         return result
@@ -508,26 +806,18 @@ def main():
     elif args.command == "info":
         manager = KurtosisManager(args.enclave)
 
-        geth_service = manager.discover_el_service("geth")
-        besu_service = manager.discover_el_service("besu")
+        (geth_service, geth_url, _), (besu_service, besu_url, _) = \
+            asyncio.run(_resolve_els(manager))
 
         info = {
             "enclave": args.enclave,
             "geth_service": geth_service,
             "besu_service": besu_service,
         }
-
-        if geth_service:
-            try:
-                info["geth_rpc_url"] = manager.get_port_url(geth_service, "rpc")
-            except Exception:
-                pass
-
-        if besu_service:
-            try:
-                info["besu_rpc_url"] = manager.get_port_url(besu_service, "rpc")
-            except Exception:
-                pass
+        if geth_url:
+            info["geth_rpc_url"] = geth_url
+        if besu_url:
+            info["besu_rpc_url"] = besu_url
 
         print(json.dumps(info, indent=2))
 
@@ -0,0 +1,73 @@
+"""
+Shared HTTP and JSON helpers for the JSON-RPC tools.
+
+kurtosis_manager, rpc_diagnostics and call_tracer_tests parse and encode
+JSON-RPC payloads and pool their HTTP connections through these helpers.
+"""
+
+import functools
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to compact (or indented) JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def new_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 4,
+    retries: int = 0,
+    backoff_factor: float = 0.0
+):
+    """
+    Create a keep-alive requests Session with a sized connection pool.
+
+    With ``retries=0`` failed requests are not retried by the adapter, for
+    callers that run their own polling loops. requests is imported here so
+    that importing this module doesn't need it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["Accept"] = "application/json"
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            read=None if retries else False,
+            backoff_factor=backoff_factor
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.cache
+def session():
+    """Process-wide keep-alive session, created on first use."""
+    return new_session()
@@ -8,10 +8,39 @@ This script helps diagnose issues with Geth/Besu RPC endpoints.
 import argparse
 import json
 import sys
-import time
 
 import requests
 
+from rpc_common import JSON_HEADERS, dumps as _dumps, loads as _loads, session as _session
+
+
+def _snippet(response, limit: int = 500) -> str:
+    """
+    First ``limit`` bytes of a response body, for error reports.
+
+    Response bodies are only ever read as bytes (``response.content``); the
+    success path never touches ``response.text``, which decodes the whole
+    body and may run charset detection first.
+    """
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+
+# Standard methods checked on every run
+ETH_METHODS = [
+    ("eth_blockNumber", []),
+    ("eth_chainId", []),
+    ("eth_syncing", []),
+    ("net_version", []),
+    ("web3_clientVersion", []),
+]
+
+# debug_* methods (may not be available on all nodes). We can't test
+# debug_traceTransaction without a real tx hash, but we can try methods that
+# might work without parameters.
+DEBUG_METHODS = [
+    ("debug_getRawHeader", ["latest"]),
+]
+
 
 def test_basic_connectivity(url: str) -> dict:
     """Test basic HTTP connectivity to the RPC endpoint."""
@@ -23,7 +52,7 @@ def test_basic_connectivity(url: str) -> dict:
     }
 
     try:
-        response = requests.get(url, timeout=5)
+        response = _session().get(url, timeout=5)
         result["details"]["status_code"] = response.status_code
         result["details"]["accessible"] = True
         result["success"] = True
@@ -45,6 +74,32 @@ def test_basic_connectivity(url: str) -> dict:
     return result
 
 
+def _method_result(url: str, method: str, http_status: int, data) -> dict:
+    """Build a test_rpc_method-shaped result from a single JSON-RPC response."""
+    result = {
+        "test": f"RPC Method: {method}",
+        "url": url,
+        "success": False,
+        "details": {"http_status": http_status}
+    }
+
+    if data is None:
+        result["details"]["note"] = "No response for this request in batch"
+        return result
+
+    result["details"]["response"] = data
+    if "result" in data:
+        result["success"] = True
+        result["details"]["result"] = data["result"]
+        result["details"]["note"] = "Method call successful"
+    elif "error" in data:
+        result["details"]["rpc_error"] = data["error"]
+        result["details"]["note"] = "RPC returned an error"
+    else:
+        result["details"]["note"] = "Unexpected response format"
+    return result
+
+
 def test_rpc_method(url: str, method: str, params: list = None) -> dict:
     """Test a specific JSON-RPC method."""
     if params is None:
@@ -65,77 +120,88 @@ def test_rpc_method(url: str, method: str, params: list = None) -> dict:
     }
 
     try:
-        response = requests.post(
+        response = _session().post(
             url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
+            data=_dumps(payload),
+            headers=JSON_HEADERS,
             timeout=10
         )
 
         result["details"]["http_status"] = response.status_code
 
         if response.status_code == 200:
-            data = response.json()
-            result["details"]["response"] = data
-
-            if "result" in data:
-                result["success"] = True
-                result["details"]["result"] = data["result"]
-                result["details"]["note"] = "Method call successful"
-            elif "error" in data:
-                result["details"]["rpc_error"] = data["error"]
-                result["details"]["note"] = "RPC returned an error"
-            else:
-                result["details"]["note"] = "Unexpected response format"
-        else:
-            result["details"]["http_error"] = response.text[:500]
+            return _method_result(url, method, response.status_code, _loads(response.content))
+
+        result["details"]["http_error"] = _snippet(response)
 
     except requests.exceptions.Timeout:
         result["details"]["error"] = "Request timeout after 10 seconds"
     except requests.exceptions.ConnectionError as e:
         result["details"]["error"] = f"Connection error: {str(e)}"
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # Also covers orjson.JSONDecodeError
         result["details"]["error"] = "Invalid JSON response"
-        result["details"]["raw_response"] = response.text[:500]
+        result["details"]["raw_response"] = _snippet(response)
     except Exception as e:
         result["details"]["error"] = f"Unexpected error: {type(e).__name__}: {str(e)}"
 
     return result
 
 
-def test_eth_methods(url: str) -> list:
-    """Test common Ethereum JSON-RPC methods."""
-    methods = [
-        ("eth_blockNumber", []),
-        ("eth_chainId", []),
-        ("eth_syncing", []),
-        ("net_version", []),
-        ("web3_clientVersion", []),
+def test_rpc_batch(url: str, methods: list) -> list:
+    """
+    Test several JSON-RPC methods with a single batch request.
+
+    Returns one result per method, in order, with the same shape as
+    test_rpc_method. Falls back to individual calls if the endpoint does
+    not answer the batch with a JSON array.
+    """
+    payload = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+        for i, (method, params) in enumerate(methods)
+    ]
+
+    try:
+        response = _session().post(
+            url,
+            data=_dumps(payload),
+            headers=JSON_HEADERS,
+            timeout=10
+        )
+        data = _loads(response.content) if response.status_code == 200 else None
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+        error = ("Request timeout after 10 seconds"
+                 if isinstance(e, requests.exceptions.Timeout)
+                 else f"Connection error: {str(e)}")
+        return [
+            {
+                "test": f"RPC Method: {method}",
+                "url": url,
+                "success": False,
+                "details": {"error": error}
+            }
+            for method, _ in methods
+        ]
+    except Exception:
+        data = None
+
+    if not isinstance(data, list):
+        return [test_rpc_method(url, method, params) for method, params in methods]
+
+    by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+    return [
+        _method_result(url, method, response.status_code, by_id.get(i))
+        for i, (method, _) in enumerate(methods)
     ]
 
-    results = []
-    for method, params in methods:
-        result = test_rpc_method(url, method, params)
-        results.append(result)
-        time.sleep(0.1)  # Small delay between requests
 
-    return results
+def test_eth_methods(url: str) -> list:
+    """Test common Ethereum JSON-RPC methods."""
+    return test_rpc_batch(url, ETH_METHODS)
 
 
 def test_debug_methods(url: str) -> list:
     """Test debug_* methods (may not be available on all nodes)."""
-    # We can't test debug_traceTransaction without a real tx hash
-    # But we can try methods that might work without parameters
-    methods = [
-        ("debug_getRawHeader", ["latest"]),
-    ]
-
-    results = []
-    for method, params in methods:
-        result = test_rpc_method(url, method, params)
-        results.append(result)
-
-    return results
+    return test_rpc_batch(url, DEBUG_METHODS)
 
 
 def print_result(result: dict) -> None:
@@ -161,19 +227,33 @@ def run_diagnostics(url: str, include_debug: bool = False, verbose: bool = False
     print("=" * 60)
 
     all_results = []
+    step = 1
+
+    def check_connectivity() -> None:
+        nonlocal step
+        print(f"\n{step}. Testing basic connectivity...")
+        step += 1
+        result = test_basic_connectivity(url)
+        all_results.append(result)
+        if verbose or not result["success"]:
+            print_result(result)
+        else:
+            print("  ✓ Endpoint is accessible")
 
-    # Test 1: Basic connectivity
-    print("\n1. Testing basic connectivity...")
-    result = test_basic_connectivity(url)
-    all_results.append(result)
-    if verbose or not result["success"]:
-        print_result(result)
-    elif result["success"]:
-        print("  ✓ Endpoint is accessible")
-
-    # Test 2: Standard Ethereum methods
-    print("\n2. Testing standard Ethereum RPC methods...")
-    eth_results = test_eth_methods(url)
+    # A successful RPC call already proves the endpoint is reachable, so the
+    # connectivity probe runs up front only in verbose mode and otherwise just
+    # to diagnose a total failure.
+    if verbose:
+        check_connectivity()
+
+    # Standard Ethereum methods
+    print(f"\n{step}. Testing standard Ethereum RPC methods...")
+    step += 1
+    # Debug methods ride along in the same batch when requested
+    methods = ETH_METHODS + DEBUG_METHODS if include_debug else ETH_METHODS
+    batch_results = test_rpc_batch(url, methods)
+    eth_results = batch_results[:len(ETH_METHODS)]
+    debug_results = batch_results[len(ETH_METHODS):]
     all_results.extend(eth_results)
 
     passed = sum(1 for r in eth_results if r["success"])
@@ -194,10 +274,12 @@ def run_diagnostics(url: str, include_debug: bool = False, verbose: bool = False
                 if not result["success"] and "error" in result["details"]:
                     print(f"      Error: {result['details']['error']}")
 
-    # Test 3: Debug methods (optional)
+    if not verbose and passed == 0:
+        check_connectivity()
+
+    # Debug methods (optional)
     if include_debug:
-        print("\n3. Testing debug RPC methods...")
-        debug_results = test_debug_methods(url)
+        print(f"\n{step}. Testing debug RPC methods...")
         all_results.extend(debug_results)
 
         for result in debug_results:
@@ -0,0 +1,154 @@
+"""Tests for json_comparator."""
+
+import copy
+import difflib
+import unittest
+
+from json_comparator import (
+    _dumps_sorted,
+    compare_call_traces,
+    compare_json_recursive,
+    format_json_diff,
+    normalize_call_trace,
+    normalize_call_trace_inplace
+)
+
+
+def call_chain(depth: int, leaf_gas_used: str = "0x5") -> dict:
+    """A trace of ``depth`` nested calls, each frame calling the next."""
+    root = frame = {"type": "CALL", "gas": "0x10", "gasUsed": "0x5"}
+    for _ in range(depth):
+        child = {"type": "CALL", "gas": "0x10", "gasUsed": "0x5"}
+        frame["calls"] = [child]
+        frame = child
+    frame["gasUsed"] = leaf_gas_used
+    return root
+
+
+class DeepTraceTest(unittest.TestCase):
+    """Deeply nested traces must not hit the interpreter recursion limit."""
+
+    DEPTH = 3000
+
+    def test_normalize_deep_trace(self):
+        normalized = normalize_call_trace(call_chain(self.DEPTH, "0x05"))
+        frame = normalized
+        for _ in range(self.DEPTH):
+            frame = frame["calls"][0]
+        self.assertEqual(frame["gasUsed"], "0x5")
+
+    def test_compare_identical_deep_traces(self):
+        result = compare_call_traces(call_chain(self.DEPTH), call_chain(self.DEPTH))
+        self.assertTrue(result.is_match)
+
+    def test_compare_deep_traces_differing_at_leaf(self):
+        result = compare_call_traces(call_chain(self.DEPTH), call_chain(self.DEPTH, "0x6"))
+        self.assertFalse(result.is_match)
+        self.assertEqual(len(result.differences), 1)
+        self.assertEqual(result.differences[0].path, "root" + ".calls[0]" * self.DEPTH + ".gasUsed")
+
+    def test_compare_json_recursive_deep_traces(self):
+        differences = compare_json_recursive(call_chain(self.DEPTH), call_chain(self.DEPTH, "0x6"))
+        self.assertEqual(len(differences), 1)
+        self.assertEqual(differences[0].path, "root" + ".calls[0]" * self.DEPTH + ".gasUsed")
+
+
+class InplaceNormalizationTest(unittest.TestCase):
+    """normalize_call_trace_inplace must match the copying normalizer."""
+
+    TRACE = {
+        "type": "CALL",
+        "from": "0x01",
+        "to": "0x02",
+        "gas": "0x0010",
+        "gasUsed": "0x00",
+        "value": "0x000",
+        "input": "0x00ab",
+        "output": None,
+        "error": None,
+        "extra": "dropped",
+        "calls": [
+            {"type": "STATICCALL", "gas": "0x05", "gasUsed": "0x5", "calls": []},
+            {"type": "CREATE", "gas": "0x7", "gasUsed": "0x01", "value": None, "calls": None},
+            {
+                "type": "DELEGATECALL",
+                "gas": "0x09",
+                "gasUsed": "0x9",
+                "calls": [{"type": "CALL", "gas": "0x00", "gasUsed": "0x0"}]
+            }
+        ]
+    }
+
+    def test_matches_normalize_call_trace(self):
+        expected = normalize_call_trace(self.TRACE)
+        trace = copy.deepcopy(self.TRACE)
+        self.assertIs(normalize_call_trace_inplace(trace), trace)
+        self.assertEqual(trace, expected)
+        # Quantities lose leading zeros; input data is left alone
+        self.assertEqual(trace["gas"], "0x10")
+        self.assertEqual(trace["value"], "0x0")
+        self.assertEqual(trace["input"], "0x00ab")
+        self.assertNotIn("calls", trace["calls"][0])
+        self.assertNotIn("calls", trace["calls"][1])
+
+    def test_compare_call_traces_inplace(self):
+        besu = copy.deepcopy(self.TRACE)
+        besu["calls"][2]["calls"][0]["gasUsed"] = "0x1"
+        besu["output"] = "0x"
+        expected = compare_call_traces(self.TRACE, besu)
+        result = compare_call_traces(copy.deepcopy(self.TRACE), copy.deepcopy(besu), inplace=True)
+        self.assertEqual(result.differences, expected.differences)
+        self.assertEqual(result.geth_normalized, expected.geth_normalized)
+        self.assertEqual(result.besu_normalized, expected.besu_normalized)
+
+
+class FormatJsonDiffTest(unittest.TestCase):
+    """format_json_diff must produce the same hunks as difflib.unified_diff."""
+
+    BASE = {
+        "type": "CALL",
+        "gas": "0x10",
+        "gasUsed": "0x5",
+        "calls": [{"type": "STATICCALL", "gas": str(i), "input": "0x"} for i in range(6)]
+    }
+
+    def assert_matches_unified_diff(self, geth, besu, context):
+        expected = "\n".join(difflib.unified_diff(
+            _dumps_sorted(geth).splitlines(),
+            _dumps_sorted(besu).splitlines(),
+            fromfile="Geth",
+            tofile="Besu",
+            lineterm="",
+            n=context
+        ))
+        self.assertEqual(format_json_diff(geth, besu, context=context), expected)
+
+    def test_hunks_match_unified_diff(self):
+        changed = copy.deepcopy(self.BASE)
+        changed["gasUsed"] = "0x6"
+        changed["calls"][4]["input"] = "0xab"
+
+        inserted = copy.deepcopy(self.BASE)
+        inserted["calls"].insert(3, {"type": "CREATE"})
+        inserted["value"] = "0x1"
+
+        deleted = copy.deepcopy(self.BASE)
+        del deleted["calls"][1:4]
+        del deleted["type"]
+
+        for besu in (changed, inserted, deleted, {}):
+            for context in (0, 1, 3):
+                with self.subTest(besu=besu, context=context):
+                    self.assert_matches_unified_diff(self.BASE, besu, context)
+                    self.assert_matches_unified_diff(besu, self.BASE, context)
+
+    def test_single_line_values(self):
+        for context in (0, 3):
+            self.assert_matches_unified_diff(1, 2, context)
+
+    def test_equal_objects(self):
+        self.assertEqual(format_json_diff(self.BASE, copy.deepcopy(self.BASE)), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
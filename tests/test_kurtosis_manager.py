@@ -0,0 +1,107 @@
+"""Tests for kurtosis_manager."""
+
+import asyncio
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import kurtosis_manager
+from kurtosis_manager import KurtosisManager
+
+
+class StubPort:
+    def __init__(self, number: int):
+        self.number = number
+
+
+class StubServiceContext:
+    def __init__(self, ports: dict):
+        self._ports = ports
+
+    def get_public_ports(self) -> dict:
+        return self._ports
+
+    def get_maybe_public_ip_address(self) -> str:
+        return "10.0.0.5"
+
+
+class StubEnclaveContext:
+    SERVICES = {
+        "cl-1-teku-geth": StubServiceContext({"http": StubPort(33001)}),
+        "el-1-geth-teku": StubServiceContext({"rpc": StubPort(32001)}),
+        "el-2-besu-teku": StubServiceContext({"rpc": StubPort(32002)}),
+    }
+
+    def get_services(self) -> dict:
+        return {name: f"uuid-{name}" for name in self.SERVICES}
+
+    def get_service_context(self, service: str) -> StubServiceContext:
+        return self.SERVICES[service]
+
+
+class StubKurtosisContext:
+    enclaves = []
+
+    @classmethod
+    def create_from_local_engine(cls) -> "StubKurtosisContext":
+        return cls()
+
+    def get_enclave_context(self, enclave: str) -> StubEnclaveContext:
+        self.enclaves.append(enclave)
+        return StubEnclaveContext()
+
+
+class FailingEnclaveContext(StubEnclaveContext):
+    def get_services(self) -> dict:
+        raise RuntimeError("engine unavailable")
+
+
+class SdkTest(unittest.TestCase):
+    """Read paths go through a stub KurtosisContext when the SDK is present."""
+
+    def setUp(self):
+        patcher = mock.patch.object(kurtosis_manager, "KurtosisContext", StubKurtosisContext)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        StubKurtosisContext.enclaves = []
+        self.manager = KurtosisManager(enclave="test-enclave")
+        # Any CLI call would mean the SDK path was not used
+        self.manager._run_cmd = mock.Mock(side_effect=AssertionError("CLI used"))
+        self.manager._run_cmd_async = mock.Mock(side_effect=AssertionError("CLI used"))
+
+    def test_enclave_context(self):
+        self.assertTrue(self.manager.enclave_exists())
+        self.assertTrue(self.manager.enclave_exists())
+        self.assertEqual(StubKurtosisContext.enclaves, ["test-enclave"])
+
+    def test_service_list(self):
+        services = asyncio.run(self.manager._list_services())
+        self.assertEqual(services, list(StubEnclaveContext.SERVICES))
+        self.assertEqual(
+            self.manager.discover_el_services(),
+            {"geth": "el-1-geth-teku", "besu": "el-2-besu-teku"}
+        )
+        self.assertEqual(self.manager.discover_cl_service(), "cl-1-teku-geth")
+
+    def test_port_url(self):
+        self.assertEqual(self.manager.get_port_url("el-1-geth-teku", "rpc"), "http://10.0.0.5:32001")
+        self.assertEqual(self.manager.get_port_url("cl-1-teku-geth"), "http://10.0.0.5:33001")
+
+    def test_engine_error_falls_back_with_warning(self):
+        self.manager._enclave_context = FailingEnclaveContext()
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertIsNone(self.manager._sdk_services())
+            self.assertIsNone(self.manager._sdk_services())
+        self.assertEqual(stderr.getvalue().count("Warning: Kurtosis engine API service list failed"), 1)
+        self.assertIn("RuntimeError: engine unavailable", stderr.getvalue())
+
+    def test_api_misuse_is_not_hidden(self):
+        self.manager._enclave_context = object()
+        with self.assertRaises(AttributeError):
+            self.manager._sdk_services()
+
+
+if __name__ == "__main__":
+    unittest.main()
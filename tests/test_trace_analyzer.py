@@ -0,0 +1,78 @@
+"""Tests for trace_analyzer."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from call_tracer_tests import _dump_json
+from trace_analyzer import _walk_pair, analyze_gas_discrepancies, batch_analyze, count_calls
+
+from test_json_comparator import call_chain
+
+
+class DeepTraceTest(unittest.TestCase):
+    """Deeply nested traces must not hit the interpreter recursion limit."""
+
+    DEPTH = 3000
+
+    def test_gas_discrepancies_identical_deep_traces(self):
+        self.assertEqual(analyze_gas_discrepancies(call_chain(self.DEPTH), call_chain(self.DEPTH)), [])
+
+    def test_gas_discrepancies_deep_traces_differing_at_leaf(self):
+        discrepancies = analyze_gas_discrepancies(call_chain(self.DEPTH), call_chain(self.DEPTH, "0x6"))
+        self.assertEqual(discrepancies, [{
+            "path": "root" + ".calls[0]" * self.DEPTH,
+            "field": "gasUsed",
+            "geth": 5,
+            "besu": 6,
+            "difference": 1
+        }])
+
+    def test_walk_pair_deep_traces(self):
+        for besu_leaf in ("0x5", "0x6"):
+            walk = _walk_pair(call_chain(self.DEPTH), call_chain(self.DEPTH, besu_leaf))
+            self.assertEqual(walk["gas_discrepancies"],
+                             analyze_gas_discrepancies(call_chain(self.DEPTH), call_chain(self.DEPTH, besu_leaf)))
+            self.assertEqual(walk["geth_call_counts"], {"CALL": self.DEPTH + 1})
+            self.assertEqual(walk["besu_call_counts"], {"CALL": self.DEPTH + 1})
+
+    def test_count_calls_deep_trace(self):
+        self.assertEqual(count_calls(call_chain(self.DEPTH)), {"CALL": self.DEPTH + 1})
+
+
+class CompressedOutputTest(unittest.TestCase):
+    """Traces written with --compress-output must be readable by batch."""
+
+    def test_batch_analyze_reads_gzipped_pair(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp)
+            geth = {"jsonrpc": "2.0", "id": 1, "result": call_chain(3)}
+            besu = {"jsonrpc": "2.0", "id": 1, "result": call_chain(3, "0x6")}
+            self.assertEqual(
+                _dump_json(geth, output_dir / "Scenario_geth.json", compress=True).name,
+                "Scenario_geth.json.gz"
+            )
+            _dump_json(besu, output_dir / "Scenario_besu.json", compress=True)
+            _dump_json(geth, output_dir / "Same_geth.json", compress=True)
+            _dump_json(geth, output_dir / "Same_besu.json")
+
+            results = batch_analyze(output_dir, max_workers=1, use_cache=False)
+
+        self.assertEqual(results, {
+            "Same": {
+                "match": True,
+                "differences": 0,
+                "gas_discrepancies": 0,
+                "error_semantic_match": True
+            },
+            "Scenario": {
+                "match": False,
+                "differences": 1,
+                "gas_discrepancies": 1,
+                "error_semantic_match": True
+            }
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,20 +10,50 @@ This tool provides detailed analysis of callTracer outputs, including:
 """
 
 import argparse
+import gzip
+import hashlib
 import json
+import mmap
+import os
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Fall back to loading whole documents with json
+    ijson = None
 
 from json_comparator import (
     compare_call_traces,
     normalize_call_trace,
     extract_gas_summary,
-    format_json_diff
+    format_json_diff,
+    traces_equal
 )
 
 
+# Trace file parser: "orjson" and "json" load the whole document, "ijson"
+# streams just the "result" object out of the file. "auto" prefers orjson,
+# then ijson when its C (yajl2) backend is available (the pure-Python one is
+# slower than json), then json.
+PARSER_BACKEND = os.environ.get("PARSER_BACKEND", "auto").lower()
+
+# Files larger than this are memory-mapped for orjson instead of read into
+# an intermediate bytes object
+_MMAP_THRESHOLD = 32 * 1024 * 1024
+
+
 # Error message normalization patterns
 # Maps Besu error patterns to normalized forms for comparison
 ERROR_NORMALIZATIONS = {
@@ -40,8 +70,24 @@ ERROR_NORMALIZATIONS = {
     r"revert": "execution reverted",
 }
 
+# Trace fields CallNode.tree_repr never displays, skipped for display-only trees
+_DISPLAY_SKIP_FIELDS = frozenset({"value", "input", "output"})
 
-@dataclass
+# ERROR_NORMALIZATIONS compiled once, in priority order. Matching ignores case
+# so messages are searched as-is rather than lowercased first.
+_ERROR_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), normalized)
+    for pattern, normalized in ERROR_NORMALIZATIONS.items()
+]
+
+
+@lru_cache(maxsize=100_000)
+def _hex_to_int(value: str) -> int:
+    """Parse a gas quantity given as a 0x-prefixed hex or decimal string."""
+    return int(value, 16) if value[:2] == "0x" else int(value)
+
+
+@dataclass(slots=True)
 class CallNode:
     """Represents a node in the call tree."""
     call_type: str
@@ -62,52 +108,94 @@ class CallNode:
             self.children = []
     
     @classmethod
-    def from_trace(cls, trace: dict, depth: int = 0) -> "CallNode":
-        """Create a CallNode from a trace dictionary."""
-        children = []
-        if "calls" in trace:
-            children = [cls.from_trace(child, depth + 1) for child in trace["calls"]]
+    def from_trace(cls, trace: dict, depth: int = 0, skip_fields: frozenset = frozenset()) -> "CallNode":
+        """
+        Create a CallNode from a trace dictionary.
+        
+        The tree is built iteratively, so deeply nested call graphs can't
+        hit the interpreter's recursion limit. Trace keys listed in
+        ``skip_fields`` ("value", "input", "output") are stored as "" so
+        the nodes don't keep potentially large calldata alive.
+        """
+        root = None
+        stack = [(None, trace, depth)]
+        while stack:
+            parent, frame, node_depth = stack.pop()
+            node = cls._from_frame(frame, node_depth, skip_fields)
+            if parent is None:
+                root = node
+            else:
+                parent.children.append(node)
+            
+            # Push children in reverse so they are attached in order
+            calls = frame.get("calls")
+            if calls:
+                stack.extend((node, child, node_depth + 1) for child in reversed(calls))
         
+        return root
+    
+    @classmethod
+    def _from_frame(cls, frame: dict, depth: int, skip_fields: frozenset = frozenset()) -> "CallNode":
+        """Create a childless CallNode from a single call frame."""
+        # Positional arguments in field order; about twice as fast as
+        # keywords when building large trees
+        get = frame.get
+        if skip_fields:
+            value = "" if "value" in skip_fields else get("value", "0x0")
+            input_data = "" if "input" in skip_fields else get("input", "0x")
+            output_data = "" if "output" in skip_fields else get("output", "0x")
+        else:
+            value = get("value", "0x0")
+            input_data = get("input", "0x")
+            output_data = get("output", "0x")
         return cls(
-            call_type=trace.get("type", "UNKNOWN"),
-            from_addr=trace.get("from", ""),
-            to_addr=trace.get("to", ""),
-            gas=trace.get("gas", "0x0"),
-            gas_used=trace.get("gasUsed", "0x0"),
-            value=trace.get("value", "0x0"),
-            input_data=trace.get("input", "0x"),
-            output_data=trace.get("output", "0x"),
-            error=trace.get("error"),
-            revert_reason=trace.get("revertReason"),
-            children=children,
-            depth=depth
+            get("type", "UNKNOWN"),
+            get("from", ""),
+            get("to", ""),
+            get("gas", "0x0"),
+            get("gasUsed", "0x0"),
+            value,
+            input_data,
+            output_data,
+            get("error"),
+            get("revertReason"),
+            [],
+            depth
         )
     
     def tree_repr(self, indent: str = "  ") -> str:
         """Generate a tree representation of the call."""
-        prefix = indent * self.depth
-        
-        # Format addresses (truncate for readability)
-        from_short = self.from_addr[:10] + "..." if len(self.from_addr) > 12 else self.from_addr
-        to_short = self.to_addr[:10] + "..." if len(self.to_addr) > 12 else self.to_addr
-        
-        # Parse hex gas values
-        gas_int = int(self.gas, 16) if self.gas.startswith("0x") else int(self.gas)
-        gas_used_int = int(self.gas_used, 16) if self.gas_used.startswith("0x") else int(self.gas_used)
-        
-        lines = [
-            f"{prefix}├─ {self.call_type} {from_short} → {to_short}",
-            f"{prefix}│  Gas: {gas_int} ({self.gas}), Used: {gas_used_int} ({self.gas_used})"
-        ]
-        
-        if self.error:
-            lines.append(f"{prefix}│  ⚠️  Error: {self.error}")
-        
-        if self.revert_reason:
-            lines.append(f"{prefix}│  Revert: {self.revert_reason}")
+        lines = []
+        append = lines.append
+        prefixes = {}
         
-        for child in self.children:
-            lines.append(child.tree_repr(indent))
+        # Preorder walk into one list of lines, joined once at the end
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            depth = node.depth
+            prefix = prefixes.get(depth)
+            if prefix is None:
+                prefix = prefixes[depth] = indent * depth
+            
+            # Format addresses (truncate for readability)
+            from_short = node.from_addr[:10] + "..." if len(node.from_addr) > 12 else node.from_addr
+            to_short = node.to_addr[:10] + "..." if len(node.to_addr) > 12 else node.to_addr
+            
+            # Parse hex gas values
+            gas_int = _hex_to_int(node.gas)
+            gas_used_int = _hex_to_int(node.gas_used)
+            
+            append(f"{prefix}├─ {node.call_type} {from_short} → {to_short}")
+            append(f"{prefix}│  Gas: {gas_int} ({node.gas}), Used: {gas_used_int} ({node.gas_used})")
+            
+            if node.error:
+                append(f"{prefix}│  ⚠️  Error: {node.error}")
+            
+            if node.revert_reason:
+                append(f"{prefix}│  Revert: {node.revert_reason}")
+            
+            stack.extend(reversed(node.children))
         
         return "\n".join(lines)
 
@@ -117,13 +205,11 @@ def normalize_error_message(error: str) -> str:
     if not error:
         return ""
     
-    error_lower = error.lower()
-    
-    for pattern, normalized in ERROR_NORMALIZATIONS.items():
-        if re.search(pattern, error_lower):
+    for regex, normalized in _ERROR_PATTERNS:
+        if regex.search(error):
             return normalized
     
-    return error_lower
+    return error.lower()
 
 
 def compare_error_messages(geth_error: Optional[str], besu_error: Optional[str]) -> dict:
@@ -151,127 +237,261 @@ def analyze_gas_discrepancies(geth_trace: dict, besu_trace: dict, path: str = "r
     """Analyze gas-related discrepancies in detail."""
     discrepancies = []
     
-    geth_gas = geth_trace.get("gas", "0x0")
-    besu_gas = besu_trace.get("gas", "0x0")
-    geth_used = geth_trace.get("gasUsed", "0x0")
-    besu_used = besu_trace.get("gasUsed", "0x0")
-    
-    # Convert to integers for comparison
-    geth_gas_int = int(geth_gas, 16) if geth_gas.startswith("0x") else int(geth_gas)
-    besu_gas_int = int(besu_gas, 16) if besu_gas.startswith("0x") else int(besu_gas)
-    geth_used_int = int(geth_used, 16) if geth_used.startswith("0x") else int(geth_used)
-    besu_used_int = int(besu_used, 16) if besu_used.startswith("0x") else int(besu_used)
-    
-    if geth_gas_int != besu_gas_int:
-        discrepancies.append({
-            "path": path,
-            "field": "gas",
-            "geth": geth_gas_int,
-            "besu": besu_gas_int,
-            "difference": besu_gas_int - geth_gas_int
-        })
-    
-    if geth_used_int != besu_used_int:
-        discrepancies.append({
-            "path": path,
-            "field": "gasUsed",
-            "geth": geth_used_int,
-            "besu": besu_used_int,
-            "difference": besu_used_int - geth_used_int
-        })
-    
-    # Recursively check nested calls
-    geth_calls = geth_trace.get("calls", [])
-    besu_calls = besu_trace.get("calls", [])
-    
-    min_len = min(len(geth_calls), len(besu_calls))
-    for i in range(min_len):
-        nested = analyze_gas_discrepancies(
-            geth_calls[i],
-            besu_calls[i],
-            f"{path}.calls[{i}]"
-        )
-        discrepancies.extend(nested)
+    # Identical traces can't contain gas discrepancies
+    if traces_equal(geth_trace, besu_trace):
+        return discrepancies
+    
+    # Walk both trees in lockstep, depth-first, so discrepancies come out in
+    # call order without recursing
+    stack = [(geth_trace, besu_trace, path)]
+    while stack:
+        geth, besu, node_path = stack.pop()
+        
+        geth_gas = geth.get("gas", "0x0")
+        besu_gas = besu.get("gas", "0x0")
+        geth_used = geth.get("gasUsed", "0x0")
+        besu_used = besu.get("gasUsed", "0x0")
+        
+        # Convert to integers for comparison
+        geth_gas_int = _hex_to_int(geth_gas)
+        besu_gas_int = _hex_to_int(besu_gas)
+        geth_used_int = _hex_to_int(geth_used)
+        besu_used_int = _hex_to_int(besu_used)
+        
+        if geth_gas_int != besu_gas_int:
+            discrepancies.append({
+                "path": node_path,
+                "field": "gas",
+                "geth": geth_gas_int,
+                "besu": besu_gas_int,
+                "difference": besu_gas_int - geth_gas_int
+            })
+        
+        if geth_used_int != besu_used_int:
+            discrepancies.append({
+                "path": node_path,
+                "field": "gasUsed",
+                "geth": geth_used_int,
+                "besu": besu_used_int,
+                "difference": besu_used_int - geth_used_int
+            })
+        
+        # Queue nested calls present in both traces
+        geth_calls = geth.get("calls", [])
+        besu_calls = besu.get("calls", [])
+        
+        min_len = min(len(geth_calls), len(besu_calls))
+        for i in range(min_len - 1, -1, -1):
+            stack.append((geth_calls[i], besu_calls[i], f"{node_path}.calls[{i}]"))
     
     return discrepancies
 
 
 def count_calls(trace: dict) -> dict:
     """Count different types of calls in a trace."""
-    counts = {}
+    counts = Counter()
     
-    call_type = trace.get("type", "UNKNOWN")
-    counts[call_type] = counts.get(call_type, 0) + 1
+    # Preorder walk, so types are keyed in order of first appearance
+    stack = [trace]
+    while stack:
+        frame = stack.pop()
+        counts[frame.get("type", "UNKNOWN")] += 1
+        stack.extend(reversed(frame.get("calls", [])))
     
-    for child in trace.get("calls", []):
-        child_counts = count_calls(child)
-        for k, v in child_counts.items():
-            counts[k] = counts.get(k, 0) + v
+    return dict(counts)
+
+
+def _walk_pair(geth_trace: dict, besu_trace: dict, path: str = "root") -> dict:
+    """
+    Walk a Geth/Besu trace pair once, collecting the gas discrepancies between
+    paired calls and the call counts for each side.
+    
+    Results match analyze_gas_discrepancies and count_calls. Calls present on
+    only one side are still counted for that side.
+    """
+    # Identical traces have no gas discrepancies and the same call counts on
+    # both sides
+    if traces_equal(geth_trace, besu_trace):
+        counts = count_calls(geth_trace)
+        return {
+            "gas_discrepancies": [],
+            "geth_call_counts": counts,
+            "besu_call_counts": dict(counts)
+        }
+    
+    discrepancies = []
+    append = discrepancies.append
+    geth_counts = Counter()
+    besu_counts = Counter()
+    hex_to_int = _hex_to_int
+    
+    # (geth frame, besu frame, path); either frame may be None below a point
+    # where the call lists diverge
+    stack = [(geth_trace, besu_trace, path)]
+    while stack:
+        geth, besu, node_path = stack.pop()
+        
+        if geth is not None:
+            geth_counts[geth.get("type", "UNKNOWN")] += 1
+        
+        if besu is not None:
+            besu_counts[besu.get("type", "UNKNOWN")] += 1
+        
+        if geth is not None and besu is not None:
+            geth_gas_int = hex_to_int(geth.get("gas", "0x0"))
+            besu_gas_int = hex_to_int(besu.get("gas", "0x0"))
+            geth_used_int = hex_to_int(geth.get("gasUsed", "0x0"))
+            besu_used_int = hex_to_int(besu.get("gasUsed", "0x0"))
+            
+            if geth_gas_int != besu_gas_int:
+                append({
+                    "path": node_path,
+                    "field": "gas",
+                    "geth": geth_gas_int,
+                    "besu": besu_gas_int,
+                    "difference": besu_gas_int - geth_gas_int
+                })
+            
+            if geth_used_int != besu_used_int:
+                append({
+                    "path": node_path,
+                    "field": "gasUsed",
+                    "geth": geth_used_int,
+                    "besu": besu_used_int,
+                    "difference": besu_used_int - geth_used_int
+                })
+        
+        # Push children in reverse so both sides are visited in preorder
+        geth_calls = geth.get("calls", []) if geth is not None else []
+        besu_calls = besu.get("calls", []) if besu is not None else []
+        for i in range(max(len(geth_calls), len(besu_calls)) - 1, -1, -1):
+            stack.append((
+                geth_calls[i] if i < len(geth_calls) else None,
+                besu_calls[i] if i < len(besu_calls) else None,
+                f"{node_path}.calls[{i}]"
+            ))
     
-    return counts
+    return {
+        "gas_discrepancies": discrepancies,
+        "geth_call_counts": dict(geth_counts),
+        "besu_call_counts": dict(besu_counts)
+    }
 
 
 def calculate_total_gas(trace: dict) -> int:
     """Calculate total gas used across all calls."""
     gas_used = trace.get("gasUsed", "0x0")
-    total = int(gas_used, 16) if gas_used.startswith("0x") else int(gas_used)
+    total = _hex_to_int(gas_used)
     
     # Note: Nested call gas is typically included in parent, so we don't add
     # This is just for verification
     return total
 
 
-def analyze_trace_file(file_path: Path) -> dict:
-    """Analyze a single trace file."""
-    with open(file_path) as f:
+def _parser_backend() -> str:
+    """Resolve PARSER_BACKEND to the parser that will actually be used."""
+    backend = PARSER_BACKEND
+    if backend == "auto":
+        if orjson is not None:
+            return "orjson"
+        if ijson is not None and getattr(ijson, "backend", None) == "yajl2_c":
+            return "ijson"
+        return "json"
+    if backend == "orjson" and orjson is None:
+        raise RuntimeError("PARSER_BACKEND=orjson but orjson is not installed")
+    if backend == "ijson" and ijson is None:
+        raise RuntimeError("PARSER_BACKEND=ijson but ijson is not installed")
+    if backend not in ("orjson", "ijson", "json"):
+        raise ValueError(f"Unknown PARSER_BACKEND: {backend}")
+    return backend
+
+
+def _load_trace(path: Path) -> Any:
+    """
+    Load the ``result`` object of a trace file with the configured parser.
+    
+    Files ending in ``.gz`` (written with --compress-output) are decompressed
+    on the fly.
+    """
+    backend = _parser_backend()
+    compressed = str(path).endswith(".gz")
+    opener = gzip.open if compressed else open
+    
+    if backend == "ijson":
+        with opener(path, "rb") as f:
+            for result in ijson.items(f, "result", use_float=True):
+                return result
+        return {}
+    
+    if backend == "orjson":
+        with opener(path, "rb") as f:
+            if not compressed and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        data = orjson.loads(view)
+            else:
+                data = orjson.loads(f.read())
+        return data.get("result", {})
+    
+    with opener(path, "rt") as f:
         data = json.load(f)
+    return data.get("result", {})
+
+
+def analyze_trace_file(file_path: Path) -> dict:
+    """
+    Analyze a single trace file.
     
-    trace = data.get("result", {})
+    The parsed trace is kept under "_raw_trace"; print_analysis builds its
+    call tree only for verbose output.
+    """
+    trace = _load_trace(file_path)
     
     return {
         "file": str(file_path),
-        "call_tree": CallNode.from_trace(trace),
+        "_raw_trace": trace,
         "call_counts": count_calls(trace),
         "total_gas_used": calculate_total_gas(trace),
         "has_error": "error" in trace,
-        "has_revert": "revertReason" in trace,
-        "normalized": normalize_call_trace(trace)
+        "has_revert": "revertReason" in trace
     }
 
 
-def compare_trace_files(geth_file: Path, besu_file: Path) -> dict:
-    """Compare two trace files in detail."""
-    with open(geth_file) as f:
-        geth_data = json.load(f)
-    with open(besu_file) as f:
-        besu_data = json.load(f)
-    
-    geth_trace = geth_data.get("result", {})
-    besu_trace = besu_data.get("result", {})
-    
-    # Basic comparison
-    comparison = compare_call_traces(geth_trace, besu_trace)
-    
-    # Detailed analysis
-    gas_discrepancies = analyze_gas_discrepancies(geth_trace, besu_trace)
+def compare_trace_files(geth_file: Path, besu_file: Path, inplace: bool = False) -> dict:
+    """
+    Compare two trace files in detail.
+    
+    The parsed traces are kept under "_geth_trace"/"_besu_trace"; print_analysis
+    builds their call trees only for verbose output. With ``inplace`` the
+    traces are normalized in place for the comparison instead of copied, so
+    those keys hold the normalized traces; use it when only the summary
+    fields are needed.
+    """
+    geth_trace = _load_trace(geth_file)
+    besu_trace = _load_trace(besu_file)
+    
+    # Gas discrepancies and call counts in a single pass, over the raw traces
+    walk = _walk_pair(geth_trace, besu_trace)
     
     error_comparison = compare_error_messages(
         geth_trace.get("error"),
         besu_trace.get("error")
     )
     
+    # Structural comparison last, since inplace normalization rewrites the
+    # traces
+    comparison = compare_call_traces(geth_trace, besu_trace, inplace=inplace)
+    
     return {
         "geth_file": str(geth_file),
         "besu_file": str(besu_file),
         "match": comparison.is_match,
         "total_differences": len(comparison.differences),
         "comparison": comparison,
-        "gas_discrepancies": gas_discrepancies,
         "error_comparison": error_comparison,
-        "geth_call_counts": count_calls(geth_trace),
-        "besu_call_counts": count_calls(besu_trace),
-        "geth_tree": CallNode.from_trace(geth_trace),
-        "besu_tree": CallNode.from_trace(besu_trace)
+        "_geth_trace": geth_trace,
+        "_besu_trace": besu_trace,
+        **walk
     }
 
 
@@ -310,10 +530,10 @@ def print_analysis(analysis: dict, verbose: bool = False) -> None:
         
         if verbose:
             print("\n--- Geth Call Tree ---")
-            print(analysis['geth_tree'].tree_repr())
+            print(CallNode.from_trace(analysis['_geth_trace'], skip_fields=_DISPLAY_SKIP_FIELDS).tree_repr())
             
             print("\n--- Besu Call Tree ---")
-            print(analysis['besu_tree'].tree_repr())
+            print(CallNode.from_trace(analysis['_besu_trace'], skip_fields=_DISPLAY_SKIP_FIELDS).tree_repr())
             
             if not analysis['match']:
                 print("\n--- Detailed Differences ---")
@@ -328,31 +548,178 @@ def print_analysis(analysis: dict, verbose: bool = False) -> None:
         
         if verbose:
             print("\n--- Call Tree ---")
-            print(analysis['call_tree'].tree_repr())
+            print(CallNode.from_trace(analysis['_raw_trace'], skip_fields=_DISPLAY_SKIP_FIELDS).tree_repr())
 
 
-def batch_analyze(output_dir: Path) -> dict:
-    """Analyze all trace files in a directory."""
-    results = {}
+def _compare_one(geth_file: Path, besu_file: Path) -> dict:
+    """Compare one scenario's trace pair and return only its batch summary."""
+    try:
+        comparison = compare_trace_files(geth_file, besu_file, inplace=True)
+        return {
+            "match": comparison["match"],
+            "differences": comparison["total_differences"],
+            "gas_discrepancies": len(comparison["gas_discrepancies"]),
+            "error_semantic_match": comparison["error_comparison"]["semantic_match"]
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _batch_cache_tag() -> str:
+    """
+    Identify the analysis code and parser that produced cached summaries.
+    
+    Any change to this module, json_comparator or the parser backend
+    invalidates the whole cache.
+    """
+    try:
+        backend = _parser_backend()
+    except (RuntimeError, ValueError):
+        backend = PARSER_BACKEND
+    digest = hashlib.sha256(backend.encode())
+    for source in (__file__, compare_call_traces.__code__.co_filename):
+        with open(source, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _load_batch_cache(cache_file: Path, tag: str) -> dict:
+    """
+    Load cached batch summaries as {scenario: {"key": [...], "summary": {...}}}.
+    
+    Returns an empty cache if the file is unreadable or was written with a
+    different tag.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("tag") != tag:
+        return {}
+    scenarios = cache.get("scenarios")
+    return scenarios if isinstance(scenarios, dict) else {}
+
+
+def _save_batch_cache(cache_file: Path, tag: str, scenarios: dict) -> None:
+    """Persist batch summaries; failing to write the cache is not an error."""
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_file, "w") as f:
+            json.dump({"tag": tag, "scenarios": scenarios}, f)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        temp_file.unlink(missing_ok=True)
+
+
+def iter_batch_analyze(
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True
+) -> Iterator[tuple[str, dict]]:
+    """
+    Analyze all trace files in a directory, yielding (scenario, summary)
+    pairs as each scenario finishes.
+    
+    Scenarios are compared in parallel worker processes; ``max_workers``
+    defaults to the number of CPUs. Gzipped trace files are picked up too.
+    With ``use_cache``, summaries are written to ``.trace_cache.json`` in the
+    directory and reused (yielded first) while both trace files keep the same
+    mtime and size and the analysis code and parser backend are unchanged.
+    """
+    cache_file = output_dir / ".trace_cache.json"
+    cache_tag = _batch_cache_tag() if use_cache else None
+    cache = _load_batch_cache(cache_file, cache_tag) if use_cache else {}
+    
+    # Bucket geth and besu files by scenario in a single directory pass.
+    # Compressed traces ({scenario}_geth.json.gz) are used when there is no
+    # uncompressed file for the same side.
+    buckets = {}
+    if output_dir.is_dir():
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                compressed = name.endswith(".gz")
+                if compressed:
+                    name = name[:-3]
+                if name.endswith("_geth.json"):
+                    side = "geth"
+                elif name.endswith("_besu.json"):
+                    side = "besu"
+                else:
+                    continue
+                sides = buckets.setdefault(name[:-10], {})
+                if not (compressed and side in sides):
+                    sides[side] = entry
     
-    # Find all geth files and their besu counterparts
-    for geth_file in output_dir.glob("*_geth.json"):
-        scenario = geth_file.stem.replace("_geth", "")
-        besu_file = output_dir / f"{scenario}_besu.json"
+    pairs = {}
+    keys = {}
+    results = {}
+    for scenario, entries in buckets.items():
+        if "geth" not in entries or "besu" not in entries:
+            continue
+        geth_entry = entries["geth"]
+        besu_entry = entries["besu"]
+        pairs[scenario] = (Path(geth_entry.path), Path(besu_entry.path))
+        geth_stat = geth_entry.stat()
+        besu_stat = besu_entry.stat()
+        keys[scenario] = [
+            geth_stat.st_mtime_ns, geth_stat.st_size,
+            besu_stat.st_mtime_ns, besu_stat.st_size
+        ]
+        # Anything but a well-formed entry for the same files is a miss
+        cached = cache.get(scenario)
+        if (isinstance(cached, dict) and cached.get("key") == keys[scenario]
+                and isinstance(cached.get("summary"), dict)):
+            results[scenario] = cached["summary"]
+    
+    pending = {scenario: pair for scenario, pair in pairs.items() if scenario not in results}
+    try:
+        yield from list(results.items())
         
-        if besu_file.exists():
-            try:
-                comparison = compare_trace_files(geth_file, besu_file)
-                results[scenario] = {
-                    "match": comparison["match"],
-                    "differences": comparison["total_differences"],
-                    "gas_discrepancies": len(comparison["gas_discrepancies"]),
-                    "error_semantic_match": comparison["error_comparison"]["semantic_match"]
+        if pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_compare_one, geth_file, besu_file): scenario
+                    for scenario, (geth_file, besu_file) in pending.items()
                 }
-            except Exception as e:
-                results[scenario] = {"error": str(e)}
-    
-    return results
+                for future in as_completed(futures):
+                    scenario = futures[future]
+                    results[scenario] = future.result()
+                    yield scenario, results[scenario]
+    finally:
+        if use_cache and (pending or cache.keys() != pairs.keys()):
+            # Errors aren't cached; they may be environmental (e.g. a missing parser)
+            _save_batch_cache(cache_file, cache_tag, {
+                scenario: {"key": keys[scenario], "summary": summary}
+                for scenario, summary in results.items()
+                if "error" not in summary
+            })
+
+
+def batch_analyze(output_dir: Path, max_workers: Optional[int] = None, use_cache: bool = True) -> dict:
+    """
+    Analyze all trace files in a directory.
+    
+    Returns summaries keyed by scenario name, in sorted order. See
+    iter_batch_analyze for parallelism and caching.
+    """
+    return dict(sorted(iter_batch_analyze(output_dir, max_workers, use_cache)))
+
+
+def _write_json_object(items: Iterable[tuple[str, Any]], out: TextIO) -> None:
+    """
+    Write (key, value) pairs to ``out`` as a single JSON object, one member
+    at a time as the pairs arrive. Formatted like json.dumps(..., indent=2).
+    """
+    separator = "{\n"
+    for key, value in items:
+        out.write(separator)
+        # Drop the enclosing "{\n" and "\n}" of a one-member object
+        out.write(json.dumps({key: value}, indent=2)[2:-2])
+        out.flush()
+        separator = ",\n"
+    out.write("{}\n" if separator == "{\n" else "\n}\n")
 
 
 def main():
@@ -380,6 +747,17 @@ def main():
         help="Directory containing trace files"
     )
     batch_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    batch_parser.add_argument(
+        "--parallelism",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)"
+    )
+    batch_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every scenario instead of reusing .trace_cache.json"
+    )
     
     # Tree command
     tree_parser = subparsers.add_parser("tree", help="Show call tree visualization")
@@ -402,15 +780,20 @@ def main():
         print_analysis(analysis, args.verbose)
         
     elif args.command == "batch":
-        results = batch_analyze(args.output_dir)
+        results = iter_batch_analyze(
+            args.output_dir,
+            max_workers=args.parallelism,
+            use_cache=not args.no_cache
+        )
         if args.json:
-            print(json.dumps(results, indent=2))
+            _write_json_object(results, sys.stdout)
         else:
+            # Report each scenario as soon as it finishes
             print("Batch Analysis Results")
-            print("=" * 60)
+            print("=" * 60, flush=True)
             passed = 0
             failed = 0
-            for scenario, result in sorted(results.items()):
+            for scenario, result in results:
                 if "error" in result:
                     status = f"✗ ERROR: {result['error']}"
                     failed += 1
@@ -420,24 +803,16 @@ def main():
                 else:
                     status = f"✗ FAIL ({result['differences']} diffs, {result['gas_discrepancies']} gas)"
                     failed += 1
-                print(f"{scenario}: {status}")
+                print(f"{scenario}: {status}", flush=True)
             print(f"\nTotal: {passed} passed, {failed} failed")
         
     elif args.command == "tree":
-        with open(args.trace_file) as f:
-            data = json.load(f)
-        trace = data.get("result", {})
-        tree = CallNode.from_trace(trace)
+        tree = CallNode.from_trace(_load_trace(args.trace_file), skip_fields=_DISPLAY_SKIP_FIELDS)
         print(tree.tree_repr())
         
     elif args.command == "diff":
-        with open(args.geth_file) as f:
-            geth_data = json.load(f)
-        with open(args.besu_file) as f:
-            besu_data = json.load(f)
-        
-        geth_trace = geth_data.get("result", {})
-        besu_trace = besu_data.get("result", {})
+        geth_trace = _load_trace(args.geth_file)
+        besu_trace = _load_trace(args.besu_file)
         
         if args.normalize:
             geth_trace = normalize_call_trace(geth_trace)